@@ -1,6 +1,7 @@
 """Claude CLI quota / rate-limit mixin."""
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -50,6 +51,12 @@ _QUOTA_PATTERNS = [
     "usage limit will reset",
 ]
 
+# All of ``_QUOTA_PATTERNS`` as one case-insensitive alternation, so a check is a
+# single scan of the output instead of lowercasing a multi-KB copy and running
+# one substring search per phrase.
+_QUOTA_RE = re.compile("|".join(map(re.escape, _QUOTA_PATTERNS)), re.IGNORECASE)
+_LIMIT_RE = re.compile("limit", re.IGNORECASE)
+
 _SESSION_NOT_FOUND_PATTERNS = (
     "no session",
     "session not found",
@@ -61,12 +68,28 @@ _SESSION_NOT_FOUND_PATTERNS = (
 
 # Matches: "Your limit will reset at 2pm (America/New_York)"
 #      or: "resets 7:30pm (Asia/Calcutta)"
+# Groups: hour, optional minute, meridiem letter (a/p), timezone name — the clock
+# time is read straight from the captures rather than re-parsed by ``strptime``.
 _RESET_RE = re.compile(
-    r"resets?\s+(?:.*?at\s+)?(\d{1,2}(?::\d{2})?\s*[ap]m)\s*\(([^)]+)\)",
+    r"resets?\s+(?:.*?at\s+)?(\d{1,2})(?::(\d{2}))?\s*([ap])m\s*\(([^)]+)\)",
     re.IGNORECASE,
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _get_zone(tz_str: str) -> ZoneInfo | None:
+    """Resolve a reset-message timezone name (alias-mapped), or ``None``.
+
+    ``ZoneInfo`` keeps its own small cache of *successful* lookups, but an
+    unknown name re-searches the tzdata path and raises on every call; caching
+    here covers the failures too and folds in the ``_TZ_ALIASES`` mapping.
+    """
+    try:
+        return ZoneInfo(_TZ_ALIASES.get(tz_str, tz_str))
+    except (KeyError, ValueError):
+        return None
+
+
 class ClaudeQuotaMixin:
     """Mixin for agents that call the Claude CLI and may encounter quota errors.
 
@@ -169,13 +192,12 @@ class ClaudeQuotaMixin:
         a usage-limit phrase paired with a parseable reset time. Topical prose
         and code that talk about rate limits no longer trip self-disable.
         """
-        lower = output.lower()
-        if any(p in lower for p in _QUOTA_PATTERNS):
+        if _QUOTA_RE.search(output) is not None:
             return True
         # A parseable reset time is only a quota signal when paired with the word
         # "limit" — Claude's real message always says e.g. "your limit will reset
         # at …". The reset time alone is too generic (could be ambient text).
-        if "limit" in lower and _RESET_RE.search(output) is not None:
+        if _LIMIT_RE.search(output) is not None and _RESET_RE.search(output) is not None:
             return True
         return False
 
@@ -191,33 +213,21 @@ class ClaudeQuotaMixin:
         if not match:
             return None
 
-        time_str = match.group(1).strip()
-        tz_str = match.group(2).strip()
+        hour_str, minute_str, meridiem, tz_str = match.groups()
 
-        canonical = _TZ_ALIASES.get(tz_str, tz_str)
-        try:
-            tz = ZoneInfo(canonical)
-        except (KeyError, ValueError):
+        tz = _get_zone(tz_str.strip())
+        if tz is None:
             return None
 
-        now = datetime.now(tz)
-
-        # Parse time — handles "2pm", "2:30pm", "10 am", etc.
-        try:
-            for fmt in ("%I%p", "%I:%M%p", "%I %p", "%I:%M %p"):
-                try:
-                    parsed = datetime.strptime(time_str.upper(), fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                return None
-        except Exception:
+        # "2pm", "2:30pm", "10 am", etc. — 12h clock to 24h.
+        hour_12 = int(hour_str)
+        minute = int(minute_str or 0)
+        if not 1 <= hour_12 <= 12 or minute > 59:
             return None
+        hour = hour_12 % 12 + (12 if meridiem.lower() == "p" else 0)
 
-        reset = now.replace(
-            hour=parsed.hour, minute=parsed.minute, second=0, microsecond=0,
-        )
+        now = datetime.now(tz)
+        reset = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         # If the reset time is in the past, it means tomorrow
         if reset <= now:
@@ -543,6 +553,11 @@ class ClaudeQuotaMixin:
         group is SIGKILLed (``start_new_session=True`` puts the CLI and any
         children in their own group) and ``(stdout_so_far, msg, 124)`` is
         returned rather than hanging the worker.
+
+        On POSIX ``communicate`` already multiplexes stdin/stdout/stderr from a
+        single ``selectors`` loop on the calling thread (no reader threads), so
+        the wait is event-driven rather than busy; there is nothing to gain from
+        layering a ``pidfd`` on top of it.
         """
         cmd = ["claude", "-p", "--dangerously-skip-permissions"]
         if extra_flags:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import logging
 import subprocess
 import uuid
@@ -29,6 +31,12 @@ logger = logging.getLogger(__name__)
 # wall-clock cap on the subprocess — ``claude -p`` exits when the turn is done.
 _DEFAULT_TURN_TIMEOUT = 30 * 60
 
+# Static head of the one-shot summary prompt; only the output tail varies.
+_SUMMARY_PREFIX = "Summarize what was done in 2-3 sentences based on this output:\n\n"
+# not configurable: the summary only needs the end of the run, and a larger
+# window just pads the summary call's prompt.
+_SUMMARY_TAIL_CHARS = 3000
+
 
 def _worker_setting(key: str, default: object) -> object:
     """Read *key* from the ``[worker]`` config section (flat fallback)."""
@@ -90,12 +98,15 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
     """Invokes Claude Code CLI to implement code changes."""
 
     name = "coding"
+    _HANDLED_TASK_TYPES = frozenset(
+        {"implement_issue", "address_review", "resolve_conflicts", "fix_ci"},
+    )
 
     def __init__(self, repo: str = "") -> None:
         self.repo = repo
 
     def _can_handle_task(self, task: Task) -> bool:
-        return task.task_type in ("implement_issue", "address_review", "resolve_conflicts", "fix_ci")
+        return task.task_type in self._HANDLED_TASK_TYPES
 
     def execute(self, task: Task, work_dir: Path) -> TaskResult:
         session_id = self._session_id_for(task)
@@ -139,7 +150,7 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
             self._mark_observe_session(task, "idle")
             cleanup_context_dir(task.worktree_key)
 
-        if output:
+        if output and logger.isEnabledFor(logging.DEBUG):
             logger.debug("Claude output: %s", truncate_for_log(output))
 
         summary = self._generate_summary(output, work_dir)
@@ -217,7 +228,7 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
             if failure is not None:
                 return failure
             implement_output = turn.text
-            if implement_output:
+            if implement_output and logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Claude output: %s", truncate_for_log(implement_output))
 
             # ── Phase 2: Coderabbit verify+fix loop ─────────────────────────
@@ -349,9 +360,19 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
 
             # ── Phase 4: Create PR ──────────────────────────────────────────
             logger.info("Issue #%d: phase 4 — creating PR", task.issue.number)
-            self._create_pr(task, branch, default_branch, work_dir)
-
-            summary = self._generate_summary(implement_output, work_dir)
+            # The summary depends only on the implement output, so its one-shot
+            # ``claude -p`` call overlaps with PR creation (which makes its own
+            # Claude call for the body) instead of running after it. The copied
+            # context keeps the summary's records in this pipeline's log.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="summary",
+            ) as summary_pool:
+                summary_future = summary_pool.submit(
+                    contextvars.copy_context().run,
+                    self._generate_summary, implement_output, work_dir,
+                )
+                self._create_pr(task, branch, default_branch, work_dir)
+                summary = summary_future.result()
             return TaskResult(success=True, output=implement_output, summary=summary, post_summary=True)
         finally:
             self._close_session(session)
@@ -437,12 +458,14 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
             logger.warning("Could not determine repo name for PR creation: %s", exc)
             repo_name = None
 
-        cmd = ["gh", "pr", "create", "--assignee", "@me", "--title", title, "--body", body, "--head", branch]
+        cmd = ["gh", "pr", "create", "--assignee", "@me", "--title", title, "--body-file", "-", "--head", branch]
         if repo_name:
             cmd += ["-R", repo_name]
 
         try:
-            result = subprocess.run(cmd, cwd=work_dir, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                cmd, input=body, cwd=work_dir, capture_output=True, text=True, check=True,
+            )
             logger.info("Created PR: %s", result.stdout.strip())
         except subprocess.CalledProcessError as exc:
             err_text = f"{exc.stdout or ''}\n{exc.stderr or ''}".lower()
@@ -564,9 +587,11 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
 
     def _generate_summary(self, output: str, work_dir: Path) -> str:
         """Use Claude to generate a brief summary of the work done."""
-        summary_prompt = f"Summarize what was done in 2-3 sentences based on this output:\n\n{output[-3000:]}"
-        logger.debug("Running summary Claude call")
-        logger.debug("Summary prompt: %s", truncate_for_log(summary_prompt))
+        summary_prompt = _SUMMARY_PREFIX + output[-_SUMMARY_TAIL_CHARS:]
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Running summary Claude call")
+            logger.debug("Summary prompt: %s", truncate_for_log(summary_prompt))
         # Bypass session: injecting a meta-summarisation turn into the issue
         # session would corrupt the conversation history that planning and
         # future review rounds rely on.
@@ -574,7 +599,7 @@ class CodingAgent(ClaudeQuotaMixin, Agent):
             summary_prompt, cwd=work_dir,
         )
         logger.debug("Summary Claude call exited with code %d", returncode)
-        if stdout:
+        if stdout and debug:
             logger.debug("Summary output: %s", truncate_for_log(stdout))
         if returncode == 0 and stdout.strip():
             return stdout.strip()
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
 
     from loony_dev.tasks.base import Task
 
+# Every NullAgent run yields the same outcome; ``TaskResult`` is frozen, so one
+# shared instance is safe to hand out.
+_NULL_RESULT = TaskResult(success=True, output="", summary="Cleanup task completed.")
+
 
 class NullAgent(Agent):
     """A no-op agent for tasks that handle themselves without Claude.
@@ -24,4 +28,4 @@ class NullAgent(Agent):
         return task.task_type == "cleanup_stuck"
 
     def execute(self, task: Task, work_dir: Path) -> TaskResult:
-        return TaskResult(success=True, output="", summary="Cleanup task completed.")
+        return _NULL_RESULT
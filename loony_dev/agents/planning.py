@@ -52,11 +52,13 @@ class PlanningAgent(ClaudeQuotaMixin, Agent):
             self._mark_observe_session(task, "idle")
             cleanup_context_dir(task.worktree_key)
 
-        logger.debug("Planning Claude CLI exited with code %d", returncode)
-        if stdout:
-            logger.debug("Planning output (%d chars): %s", len(stdout), truncate_for_log(stdout))
-        if stderr:
-            logger.debug("Planning stderr: %s", truncate_for_log(stderr))
+        # Skip the truncation copies entirely unless DEBUG will actually emit them.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Planning Claude CLI exited with code %d", returncode)
+            if stdout:
+                logger.debug("Planning output (%d chars): %s", len(stdout), truncate_for_log(stdout))
+            if stderr:
+                logger.debug("Planning stderr: %s", truncate_for_log(stderr))
 
         if returncode != 0:
             combined = f"{stdout}\n{stderr}"
@@ -7,13 +7,21 @@ import click
 
 from loony_dev import config
 from loony_dev.agents import session_hooks
-from loony_dev.agents.coding import CodingAgent
-from loony_dev.agents.null_agent import NullAgent
-from loony_dev.agents.planning import PlanningAgent
-from loony_dev.commands import install_commands
-from loony_dev.git import GitRepo
-from loony_dev.github import Repo
-from loony_dev.orchestrator import Orchestrator
+
+_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+def _configure_logging(log_file: str | Path | None) -> None:
+    """Configure stderr logging, plus a DEBUG file handler when *log_file* is set."""
+    logging.basicConfig(level=config.settings.log_level, format=_LOG_FORMAT)
+    if not log_file:
+        return
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    logging.getLogger().addHandler(file_handler)
+    logging.getLogger().info("Also writing DEBUG logs to %s", log_file)
 
 
 @click.group(cls=config.ClickGroup)
@@ -113,15 +121,16 @@ def hook_cmd(args: tuple[str, ...]) -> None:
 )
 def worker(**_) -> None:
     """Run the orchestrator worker loop for a single repository."""
-    log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    logging.basicConfig(level=config.settings.log_level, format=log_format)
+    # Worker-only imports: the supervisor and web children never pay for them.
+    from loony_dev.agents.coding import CodingAgent
+    from loony_dev.agents.null_agent import NullAgent
+    from loony_dev.agents.planning import PlanningAgent
+    from loony_dev.commands import install_commands
+    from loony_dev.git import GitRepo
+    from loony_dev.github import Repo
+    from loony_dev.orchestrator import Orchestrator
 
-    if config.settings.log_file:
-        file_handler = logging.FileHandler(config.settings.log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(logging.Formatter(log_format))
-        logging.getLogger().addHandler(file_handler)
-        logging.getLogger().info("Also writing DEBUG logs to %s", config.settings.log_file)
+    _configure_logging(config.settings.log_file)
 
     work_path = Path(config.settings.work_dir).resolve()
 
@@ -195,6 +204,9 @@ def worker(**_) -> None:
               help="How many times a crashed 'claude rc' remote-control server is relaunched "
                    "before it is left in an errored state (surfaced in the dashboard) instead "
                    "of restarted forever. Workers are unaffected.")
+@click.option("--prepare-concurrency", default=8, show_default=True,
+              help="How many newly discovered repos are cloned and have their labels "
+                   "provisioned concurrently in one discovery pass")
 @click.option("--no-remote-control", "no_remote_control", is_flag=True,
               help="Do not launch a 'claude rc' remote-control server per repo "
                    "(use in environments without Anthropic relay access to avoid restart churn).")
@@ -220,15 +232,7 @@ def supervisor_cmd(**_) -> None:
     """
     from loony_dev.supervisor import run_supervisor
 
-    log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    logging.basicConfig(level=config.settings.log_level, format=log_format)
-
-    config.settings.supervisor_log.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(config.settings.supervisor_log)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(log_format))
-    logging.getLogger().addHandler(file_handler)
-    logging.getLogger().info("Also writing DEBUG logs to %s", config.settings.supervisor_log)
+    _configure_logging(config.settings.supervisor_log)
 
     run_supervisor()
 
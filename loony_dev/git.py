@@ -74,7 +74,8 @@ class GitRepo:
 
     def _run(self, *args: str) -> subprocess.CompletedProcess[str]:
         cmd = ["git", *args]
-        logger.debug("Running: %s", " ".join(cmd))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running: %s", " ".join(cmd))
         try:
             return subprocess.run(cmd, cwd=self.work_dir, capture_output=True, text=True, check=True)
         except subprocess.CalledProcessError as exc:
@@ -88,14 +89,16 @@ class GitRepo:
             raise
 
     def ensure_main_up_to_date(self) -> None:
-        """Checkout the default branch and pull latest."""
+        """Checkout the default branch and fast-forward it to origin."""
         self._run("checkout", self.default_branch)
         self._run("fetch", "origin", self.default_branch)
+        # Merge the ref just fetched rather than ``git pull``, which would hit
+        # the network a second time for the same objects.
         try:
-            self._run("pull", "--ff-only")
+            self._run("merge", "--ff-only", f"origin/{self.default_branch}")
         except subprocess.CalledProcessError:
             logger.warning(
-                "Fast-forward pull failed; resetting local %s to origin/%s",
+                "Fast-forward merge of origin/%s failed; resetting local %s to it",
                 self.default_branch,
                 self.default_branch,
             )
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 _DEFAULTS: dict[str, int | float] = {
     "permission_cache_ttl": 600,
     "check_runs_cache_ttl": 3600,
+    "issue_comments_cache_ttl": 300,
     "max_retries": 5,
     "initial_backoff": 2.0,
 }
@@ -55,14 +56,21 @@ def is_retryable_gh_error(exc: subprocess.CalledProcessError) -> bool:
     return any(p in combined for p in _GH_RATE_LIMIT_PATTERNS + _GH_TRANSIENT_PATTERNS)
 
 
-def run_gh(*cmd: str, cwd: str | None = None) -> str:
-    """Run a gh CLI command with retry and exponential backoff on rate-limit errors."""
+def run_gh(*cmd: str, cwd: str | None = None, input: str | None = None) -> str:
+    """Run a gh CLI command with retry and exponential backoff on rate-limit errors.
+
+    *input*, when given, is written to the command's stdin (e.g. for
+    ``--body-file -``) and re-sent on each retry.
+    """
     max_retries = int(gh_setting("max_retries"))
-    logger.debug("Running: %s", " ".join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running: %s", " ".join(cmd))
     backoff = float(gh_setting("initial_backoff"))
     for attempt in range(max_retries + 1):
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, cwd=cwd)
+            result = subprocess.run(
+                cmd, input=input, capture_output=True, text=True, check=True, cwd=cwd,
+            )
             return result.stdout.strip()
         except subprocess.CalledProcessError as exc:
             if attempt < max_retries and is_retryable_gh_error(exc):
@@ -92,12 +100,16 @@ class GitHubClient:
         self.repo = repo
         self.cwd = cwd
 
-    def gh(self, *args: str) -> str:
-        """Run a gh CLI command and return stdout (with retry on rate-limit)."""
+    def gh(self, *args: str, input: str | None = None) -> str:
+        """Run a gh CLI command and return stdout (with retry on rate-limit).
+
+        Pass comment bodies as ``--body-file -`` with *input* rather than
+        ``--body``: stdin has no per-argument size limit, argv does.
+        """
         cmd = ["gh", *args]
         if args and args[0] != "api":
             cmd += ["-R", self.repo]
-        return run_gh(*cmd, cwd=self.cwd)
+        return run_gh(*cmd, cwd=self.cwd, input=input)
 
     def gh_api(self, endpoint: str) -> list | dict:
         """Call ``gh api`` for this repo and parse JSON output."""
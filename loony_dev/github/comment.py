@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import operator
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
 from loony_dev.github.content import Content
@@ -44,6 +46,13 @@ def _author_login(author: dict | None) -> str:
 class Comment:
     """A GitHub issue or PR comment."""
 
+    # Comments are the most numerous model objects (every discovery tick builds
+    # one per comment on each candidate), so they skip the per-instance dict.
+    __slots__ = (
+        "author", "body", "created_at", "id", "path", "line",
+        "kind", "html_url", "thread_id", "in_reply_to_id",
+    )
+
     def __init__(
         self,
         *,
@@ -74,7 +83,7 @@ class Comment:
 
     # --- Class-level reads ---
 
-    _ISSUE_COMMENTS_QUERY = """\
+    _COMMENT_FIELDS_FRAGMENT = """\
 fragment CommentFields on IssueComment {
   databaseId
   author { __typename login }
@@ -82,7 +91,9 @@ fragment CommentFields on IssueComment {
   url
   createdAt
 }
+"""
 
+    _ISSUE_COMMENTS_QUERY = _COMMENT_FIELDS_FRAGMENT + """
 query($owner:String!, $repo:String!, $number:Int!) {
   repository(owner:$owner, name:$repo) {
     issueOrPullRequest(number:$number) {
@@ -131,34 +142,124 @@ query($owner:String!, $repo:String!, $number:Int!) {
         ) or {}
         raw = (node.get("comments") or {}).get("nodes") or []
         comments = [cls._from_api(c, repo) for c in raw]
-        comments.sort(key=lambda c: c.created_at)
+        comments.sort(key=operator.attrgetter("created_at"))
         logger.debug("Comment.list_for_issue(#%d) returned %d comment(s)", number, len(comments))
         return comments
 
+    # Items per batched query in :meth:`_list_batched`. Keeps each request
+    # comfortably inside GitHub's GraphQL node limit.
+    # not configurable: bounded by GitHub's per-query node/complexity limit, not
+    # by anything deployment-specific; raising it risks rejected queries.
+    _BATCH_SIZE = 50
+
+    @classmethod
+    def list_for_issues(cls, numbers: Iterable[int], *, repo: Repo) -> dict[int, list[Comment]]:
+        """Batched :meth:`list_for_issue`: comments for several issues at once.
+
+        Each issue becomes an aliased ``issueOrPullRequest`` field in a single
+        GraphQL document, so discovery over K issues costs one ``gh`` fork per
+        :attr:`_BATCH_SIZE` issues instead of K. Returns ``{number: comments}``
+        with each list sorted by creation time; raises
+        :class:`CommentFetchError` on failure, exactly like the single-issue read.
+        """
+        def parse(node: dict) -> list[Comment]:
+            raw = (node.get("comments") or {}).get("nodes") or []
+            comments = [cls._from_api(c, repo) for c in raw]
+            comments.sort(key=operator.attrgetter("created_at"))
+            return comments
+
+        result = cls._list_batched(
+            numbers,
+            repo=repo,
+            alias="i",
+            selection=lambda n: (
+                f"issueOrPullRequest(number:{n}) {{\n"
+                "      ... on Issue { comments(first:100) { nodes { ...CommentFields } } }\n"
+                "      ... on PullRequest { comments(first:100) { nodes { ...CommentFields } } }\n"
+                "    }"
+            ),
+            parse=parse,
+            fragment=cls._COMMENT_FIELDS_FRAGMENT,
+            what="comments",
+        )
+        logger.debug("Comment.list_for_issues(%d item(s)) fetched", len(result))
+        return result
+
+    @classmethod
+    def _list_batched(
+        cls,
+        numbers: Iterable[int],
+        *,
+        repo: Repo,
+        alias: str,
+        selection: Callable[[int], str],
+        parse: Callable[[dict], list[Comment]],
+        fragment: str = "",
+        what: str,
+    ) -> dict[int, list[Comment]]:
+        """Run one aliased GraphQL read per :attr:`_BATCH_SIZE` item numbers.
+
+        Each number ``n`` becomes the field ``{alias}{n}: {selection(n)}`` under
+        ``repository``; *parse* turns that field's node (``{}`` when GitHub
+        returns null) into comments. *fragment* is prepended to the document.
+        Raises :class:`CommentFetchError` naming *what* on failure.
+        """
+        import subprocess
+
+        owner, _, name = repo.name.partition("/")
+        pending = list(dict.fromkeys(numbers))
+        result: dict[int, list[Comment]] = {}
+        for start in range(0, len(pending), cls._BATCH_SIZE):
+            batch = pending[start:start + cls._BATCH_SIZE]
+            fields = "\n".join(f"    {alias}{n}: {selection(n)}" for n in batch)
+            query = (
+                fragment
+                + "\nquery($owner:String!, $repo:String!) {\n"
+                + "  repository(owner:$owner, name:$repo) {\n"
+                + fields
+                + "\n  }\n}\n"
+            )
+            try:
+                response = repo.client.gh_graphql(query, owner=owner, repo=name)
+            except subprocess.CalledProcessError as exc:
+                detail = ((exc.stderr or "") + (exc.stdout or "")).strip()[:200]
+                logger.warning("Failed to fetch %s for %s: %s", what, batch, detail)
+                raise CommentFetchError(
+                    f"Failed to fetch {what} for {len(batch)} item(s)"
+                ) from exc
+
+            repository = response.get("data", {}).get("repository") or {}
+            for n in batch:
+                result[n] = parse(repository.get(f"{alias}{n}") or {})
+        return result
+
+    _REVIEW_THREADS_FIELDS = """\
+reviewThreads(first:100) {
+  nodes {
+    id
+    isResolved
+    isOutdated
+    comments(first:50) {
+      nodes {
+        databaseId
+        author { __typename login }
+        body
+        url
+        createdAt
+        path
+        line
+        replyTo { databaseId }
+        pullRequestReview { submittedAt }
+      }
+    }
+  }
+}"""
+
     _INLINE_REVIEW_THREADS_QUERY = """\
 query($owner:String!, $repo:String!, $pr:Int!) {
   repository(owner:$owner, name:$repo) {
     pullRequest(number:$pr) {
-      reviewThreads(first:100) {
-        nodes {
-          id
-          isResolved
-          isOutdated
-          comments(first:50) {
-            nodes {
-              databaseId
-              author { __typename login }
-              body
-              url
-              createdAt
-              path
-              line
-              replyTo { databaseId }
-              pullRequestReview { submittedAt }
-            }
-          }
-        }
-      }
+""" + _REVIEW_THREADS_FIELDS + """
     }
   }
 }
@@ -201,7 +302,38 @@ query($owner:String!, $repo:String!, $pr:Int!) {
             .get("reviewThreads", {})
             .get("nodes", [])
         ) or []
+        comments = cls._from_review_threads(threads, repo)
+        logger.debug(
+            "Comment.list_inline_for_pr(#%d) returned %d comment(s) across %d thread(s)",
+            pr_number, len(comments), len(threads),
+        )
+        return comments
+
+    @classmethod
+    def list_inline_for_prs(cls, numbers: Iterable[int], *, repo: Repo) -> dict[int, list[Comment]]:
+        """Batched :meth:`list_inline_for_pr`: inline comments for several PRs at once.
+
+        Each PR becomes an aliased ``pullRequest`` field in a single GraphQL
+        document, :attr:`_BATCH_SIZE` PRs per ``gh`` fork. Returns
+        ``{number: comments}``; raises :class:`CommentFetchError` on failure.
+        """
+        def parse(node: dict) -> list[Comment]:
+            threads = (node.get("reviewThreads") or {}).get("nodes") or []
+            return cls._from_review_threads(threads, repo)
+
+        result = cls._list_batched(
+            numbers,
+            repo=repo,
+            alias="p",
+            selection=lambda n: f"pullRequest(number:{n}) {{\n{cls._REVIEW_THREADS_FIELDS}\n}}",
+            parse=parse,
+            what="inline review comments",
+        )
+        logger.debug("Comment.list_inline_for_prs(%d PR(s)) fetched", len(result))
+        return result
 
+    @classmethod
+    def _from_review_threads(cls, threads: list[dict], repo: Repo) -> list[Comment]:
         comments: list[Comment] = []
         for thread in threads:
             thread_id = thread.get("id")
@@ -222,7 +354,7 @@ query($owner:String!, $repo:String!, $pr:Int!) {
                 # published review yet.
                 review = node.get("pullRequestReview") or {}
                 effective_ts = review.get("submittedAt") or node.get("createdAt", "")
-                comments.append(Comment(
+                comments.append(cls(
                     author=author,
                     body=Content(body_text, safe=safe),
                     created_at=effective_ts,
@@ -236,11 +368,6 @@ query($owner:String!, $repo:String!, $pr:Int!) {
                         None if db_id == top_db_id else top_db_id
                     ),
                 ))
-
-        logger.debug(
-            "Comment.list_inline_for_pr(#%d) returned %d comment(s) across %d thread(s)",
-            pr_number, len(comments), len(threads),
-        )
         return comments
 
     @classmethod
@@ -271,6 +398,8 @@ class WarningComment(Comment):
 
     SENTINEL_PREFIX = "<!-- loonybin-injection-warning field="
 
+    __slots__ = ("_number", "_field_name", "_injections", "_repo")
+
     def __init__(
         self,
         *,
@@ -320,9 +449,11 @@ class WarningComment(Comment):
         """Post this warning comment if it doesn't already exist."""
         if self.exists():
             return
+        self._repo._issue_comments_cache.pop(self._number, None)
         try:
             self._repo.client.gh(
-                "issue", "comment", str(self._number), "--body", str(self.body),
+                "issue", "comment", str(self._number), "--body-file", "-",
+                input=str(self.body),
             )
         except Exception as exc:
             logger.warning(
@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import time
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+from loony_dev.github.client import gh_setting
 from loony_dev.github.content import Content
-from loony_dev.github.repo import parse_datetime
+from loony_dev.github.repo import CommentsCacheEntry, parse_datetime
 
 if TYPE_CHECKING:
     from loony_dev.github.comment import Comment
@@ -39,33 +42,58 @@ class GitHubItem:
 
     Both issues and PRs use ``gh issue edit`` / ``gh issue comment`` for
     labels, assignments, and comments.
+
+    When the item was built with a label list (``_labels_known``), adding a
+    label it already shows is skipped without calling ``gh``, and successful
+    mutations keep ``labels`` in step. Items built bare (e.g. the web label
+    control's ``Issue(number=N)``) always call through.
+
+    The label list is the snapshot taken at discovery, and a human or another
+    task may change labels before ``on_complete`` / ``on_failure`` runs. So
+    removals are never skipped: a missed removal (e.g. ``in-progress``) would
+    park the item until stuck-item cleanup. A wrongly skipped add only loses a
+    label that was removed after discovery, and the next tick sees the true
+    state.
     """
 
     def __init__(self, *, number: int, _repo: Repo) -> None:
         self.number = number
         self._repo = _repo
+        self.labels: list[str] = []
+        self._labels_known = False
 
     def add_comment(self, body: str) -> None:
         """Post a comment on this issue or PR."""
-        from loony_dev.models import truncate_for_log
+        if logger.isEnabledFor(logging.DEBUG):
+            from loony_dev.models import truncate_for_log
 
-        logger.debug("add_comment(#%d): %s", self.number, truncate_for_log(body))
-        self._repo.client.gh("issue", "comment", str(self.number), "--body", body)
+            logger.debug("add_comment(#%d): %s", self.number, truncate_for_log(body))
+        self._repo._issue_comments_cache.pop(self.number, None)
+        self._repo.client.gh(
+            "issue", "comment", str(self.number), "--body-file", "-", input=body,
+        )
 
     def edit_comment(self, comment_id: int, body: str) -> None:
         """Edit an existing comment by its database ID via the REST API."""
-        from loony_dev.models import truncate_for_log
+        if logger.isEnabledFor(logging.DEBUG):
+            from loony_dev.models import truncate_for_log
 
-        logger.debug("edit_comment(#%d, comment=%d): %s", self.number, comment_id, truncate_for_log(body))
+            logger.debug("edit_comment(#%d, comment=%d): %s", self.number, comment_id, truncate_for_log(body))
+        self._repo._issue_comments_cache.pop(self.number, None)
         self._repo.client.gh_api_patch(f"issues/comments/{comment_id}", body=body)
 
     def add_label(self, label: str) -> bool:
+        if self._labels_known and label in self.labels:
+            logger.debug("add_label(#%d, %r): already present — skipping", self.number, label)
+            return True
         try:
             self._repo.client.gh("issue", "edit", str(self.number), "--add-label", label)
-            return True
         except subprocess.CalledProcessError:
             logger.warning("Failed to add label '%s' to #%d", label, self.number)
             return False
+        if label not in self.labels:
+            self.labels.append(label)
+        return True
 
     def remove_label(self, label: str) -> bool:
         """Remove *label*; return True on success, False if the ``gh`` call failed.
@@ -77,10 +105,44 @@ class GitHubItem:
         """
         try:
             self._repo.client.gh("issue", "edit", str(self.number), "--remove-label", label)
-            return True
         except subprocess.CalledProcessError:
             logger.warning("Failed to remove label '%s' from #%d", label, self.number)
             return False
+        if label in self.labels:
+            self.labels.remove(label)
+        return True
+
+    def update_labels(self, *, add: Iterable[str] = (), remove: Iterable[str] = ()) -> bool:
+        """Apply several label changes in a single ``gh issue edit`` call.
+
+        Lifecycle transitions swap labels in one step (e.g. drop
+        ``ready-for-development``, add ``in-progress``); doing it as one edit
+        costs one ``gh`` call instead of one per label. Adds the known label set
+        already shows are dropped first, as in :meth:`add_label`; removals always
+        go through (see the class docstring on snapshot staleness). Returns False
+        if the ``gh`` call failed, in which case none of the changes should be
+        assumed applied.
+        """
+        to_add = [l for l in add if not (self._labels_known and l in self.labels)]
+        to_remove = list(remove)
+        if not to_add and not to_remove:
+            return True
+        args = ["issue", "edit", str(self.number)]
+        for label in to_add:
+            args += ["--add-label", label]
+        for label in to_remove:
+            args += ["--remove-label", label]
+        try:
+            self._repo.client.gh(*args)
+        except subprocess.CalledProcessError:
+            logger.warning(
+                "Failed to update labels on #%d (add=%s, remove=%s)",
+                self.number, to_add, to_remove,
+            )
+            return False
+        self.labels = [l for l in self.labels if l not in to_remove]
+        self.labels += [l for l in to_add if l not in self.labels]
+        return True
 
     def assign(self, user: str = "@me") -> None:
         try:
@@ -181,7 +243,11 @@ class Issue(GitHubItem):
         self.author = author
         self.updated_at = updated_at
         self.labels: list[str] = labels or []
+        self._labels_known = labels is not None
         self.assignees: list[str] = assignees or []
+        # Set by :meth:`prefetch_comments` during discovery; None means "fetch
+        # on access".
+        self._comments: list[Comment] | None = None
 
     # --- Class-level reads ---
 
@@ -225,6 +291,63 @@ class Issue(GitHubItem):
         logger.debug("Issue.list(label=%r) returned %d issue(s)", label, len(result))
         return result
 
+    @classmethod
+    def prefetch_comments(cls, issues: list[Issue], *, repo: Repo) -> None:
+        """Load :attr:`comments` for every issue in *issues* with one batched read.
+
+        Pipeline discovery calls this so the per-issue planning/implementation
+        predicates read already-fetched comments rather than each forking
+        ``gh`` for its own query. Raises ``CommentFetchError`` on failure.
+
+        Comments are cached across ticks in ``repo._issue_comments_cache`` and
+        reused while the issue's ``updatedAt`` is unchanged (a new comment bumps
+        it) and the entry is younger than ``issue_comments_cache_ttl``. Our own
+        comment writes evict the entry (:meth:`GitHubItem.add_comment` /
+        :meth:`~GitHubItem.edit_comment`, ``Repo.post_comment`` and
+        ``WarningComment.save``).
+        Entries for issues not passed in are dropped, bounding the cache to the
+        current candidates.
+        """
+        from loony_dev.github.comment import Comment
+
+        cache = repo._issue_comments_cache
+        now = time.monotonic()
+        ttl = gh_setting("issue_comments_cache_ttl")
+        stale: list[Issue] = []
+        for issue in issues:
+            entry = cache.get(issue.number)
+            if (
+                entry is not None
+                and issue.updated_at is not None
+                and entry.updated_at == issue.updated_at
+                and now - entry.cached_at < ttl
+            ):
+                issue._comments = entry.comments
+            else:
+                stale.append(issue)
+        logger.debug(
+            "Issue.prefetch_comments: %d cached, %d to fetch",
+            len(issues) - len(stale), len(stale),
+        )
+
+        if stale:
+            by_number = Comment.list_for_issues([i.number for i in stale], repo=repo)
+            for issue in stale:
+                issue._comments = by_number.get(issue.number, [])
+                cache[issue.number] = CommentsCacheEntry(
+                    updated_at=issue.updated_at,
+                    comments=issue._comments,
+                    cached_at=now,
+                )
+
+        # Task-pool threads evict entries concurrently (add_comment /
+        # edit_comment from on_complete / on_failure), so iterate a snapshot
+        # and tolerate a key that has already gone.
+        wanted = {i.number for i in issues}
+        for number in list(cache):
+            if number not in wanted:
+                cache.pop(number, None)
+
     @classmethod
     def _from_api(cls, data: dict, repo: Repo) -> Issue:
         return cls(
@@ -242,9 +365,11 @@ class Issue(GitHubItem):
 
     @property
     def comments(self) -> list[Comment]:
-        """Fetch comments for this issue."""
+        """Comments for this issue — prefetched if available, else fetched now."""
         from loony_dev.github.comment import Comment
 
+        if self._comments is not None:
+            return list(self._comments)
         return Comment.list_for_issue(self.number, repo=self._repo)
 
     def find_pr(self) -> PullRequest | None:
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 from loony_dev.github.client import gh_setting
 from loony_dev.github.content import Content
 from loony_dev.github.issue import GitHubItem
-from loony_dev.github.repo import CheckRunsCacheEntry, parse_datetime
+from loony_dev.github.repo import CheckRunsCacheEntry, CommentsCacheEntry, parse_datetime
 
 if TYPE_CHECKING:
     from loony_dev.github.check_run import CheckRun
@@ -50,10 +50,14 @@ class PullRequest(GitHubItem):
         self.mergeable = mergeable
         self.updated_at = updated_at
         self.labels: list[str] = labels or []
+        self._labels_known = labels is not None
         self.comments: list[Comment] = comments or []
         self.reviews: list[Comment] = reviews or []
         self.assignees: list[dict] = assignees or []
         self.new_comments: list[Comment] = new_comments or []
+        # Set by :meth:`prefetch_inline_comments` during discovery; None means
+        # "fetch on access".
+        self._inline_comments: list[Comment] | None = None
 
     # --- Class-level reads ---
 
@@ -114,42 +118,78 @@ class PullRequest(GitHubItem):
         return result
 
     @classmethod
-    def _from_api(cls, data: dict, repo: Repo) -> PullRequest:
+    def prefetch_inline_comments(cls, prs: list[PullRequest], *, repo: Repo) -> None:
+        """Load :attr:`inline_comments` for every PR in *prs* with one batched read.
+
+        Pipeline discovery calls this so the review predicate reads
+        already-fetched review threads rather than forking ``gh`` per PR.
+        Raises ``CommentFetchError`` on failure.
+
+        Like :meth:`Issue.prefetch_comments`, results are cached across ticks
+        in ``repo._pr_inline_comments_cache`` and reused while the PR's
+        ``updatedAt`` is unchanged (a new review comment or reply bumps it) and
+        the entry is younger than ``issue_comments_cache_ttl``. Entries for PRs
+        not passed in are dropped.
+        """
         from loony_dev.github.comment import Comment
 
+        cache = repo._pr_inline_comments_cache
+        now = time.monotonic()
+        ttl = gh_setting("issue_comments_cache_ttl")
+        stale: list[PullRequest] = []
+        for pr in prs:
+            entry = cache.get(pr.number)
+            if (
+                entry is not None
+                and pr.updated_at is not None
+                and entry.updated_at == pr.updated_at
+                and now - entry.cached_at < ttl
+            ):
+                pr._inline_comments = entry.comments
+            else:
+                stale.append(pr)
+
+        if stale:
+            by_number = Comment.list_inline_for_prs([pr.number for pr in stale], repo=repo)
+            for pr in stale:
+                pr._inline_comments = by_number.get(pr.number, [])
+                cache[pr.number] = CommentsCacheEntry(
+                    updated_at=pr.updated_at,
+                    comments=pr._inline_comments,
+                    cached_at=now,
+                )
+
+        # Same concurrent-eviction tolerance as Issue.prefetch_comments.
+        wanted = {pr.number for pr in prs}
+        for number in list(cache):
+            if number not in wanted:
+                cache.pop(number, None)
+
+    @classmethod
+    def _from_api(cls, data: dict, repo: Repo) -> PullRequest:
+        from loony_dev.github.comment import Comment, _author_login
+
         pr_number = data["number"]
-        comments = [
-            Comment(
-                author=c.get("author", {}).get("login", ""),
-                body=Content(
-                    c.get("body", ""),
-                    safe=(c.get("author", {}).get("login", "") == repo.bot_name),
-                ),
-                created_at=c.get("createdAt", ""),
-                kind="issue",
-                html_url=c.get("url"),
-            )
-            for c in data.get("comments", [])
-        ]
-        reviews = [
-            Comment(
-                author=r.get("author", {}).get("login", ""),
-                body=Content(
-                    r.get("body", ""),
-                    safe=(r.get("author", {}).get("login", "") == repo.bot_name),
-                ),
-                created_at=r.get("submittedAt", ""),
-                kind="review_body",
-                html_url=r.get("url"),
+        bot_name = repo.bot_name
+
+        def to_comment(node: dict, kind: str, timestamp_key: str) -> Comment:
+            author = _author_login(node.get("author"))
+            return Comment(
+                author=author,
+                body=Content(node.get("body", ""), safe=(author == bot_name)),
+                created_at=node.get(timestamp_key, ""),
+                kind=kind,
+                html_url=node.get("url"),
             )
-            for r in data.get("reviews", [])
-        ]
+
+        comments = [to_comment(c, "issue", "createdAt") for c in data.get("comments") or ()]
+        reviews = [to_comment(r, "review_body", "submittedAt") for r in data.get("reviews") or ()]
         return cls(
             number=pr_number,
             branch=data.get("headRefName", ""),
             title=Content(data.get("title", "")),
             body=Content(data.get("body", "")),
-            author=data.get("author", {}).get("login", ""),
+            author=_author_login(data.get("author")),
             head_sha=data.get("headRefOid", ""),
             mergeable=data.get("mergeable"),
             updated_at=parse_datetime(data.get("updatedAt")),
@@ -195,9 +235,11 @@ class PullRequest(GitHubItem):
 
     @property
     def inline_comments(self) -> list[Comment]:
-        """Fetch inline review comments for this PR."""
+        """Fetch inline review comments for this PR (prefetched during discovery)."""
         from loony_dev.github.comment import Comment
 
+        if self._inline_comments is not None:
+            return list(self._inline_comments)
         return Comment.list_inline_for_pr(self.number, repo=self._repo)
 
     @property
@@ -2,17 +2,27 @@
 from __future__ import annotations
 
 import functools
+import hashlib
+import json
 import logging
+import os
 import subprocess
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from loony_dev.github.client import GitHubClient, gh_setting, run_gh
 
 logger = logging.getLogger(__name__)
 
+# Environment variable through which the supervisor hands its already-detected
+# bot login to spawned workers, so N workers don't each fork ``gh api user``.
+# Consulted only by ``detect_bot_name`` — an explicit ``--bot-name`` / config
+# ``bot_name`` still wins.
+BOT_NAME_ENV = "LOONY_DEV_DETECTED_BOT_NAME"
+
 # ---------------------------------------------------------------------------
 # Authorization helpers
 # ---------------------------------------------------------------------------
@@ -53,6 +63,12 @@ REQUIRED_LABELS = [
     {"name": "in-error",              "color": "b60205", "description": "Bot has failed repeatedly; manual intervention required"},
 ]
 
+# Fingerprint of REQUIRED_LABELS written to the provisioning sentinel, so
+# changing the label set (or a colour/description) re-triggers provisioning.
+_REQUIRED_LABELS_DIGEST = hashlib.sha256(
+    json.dumps(REQUIRED_LABELS, sort_keys=True).encode()
+).hexdigest()
+
 
 # ---------------------------------------------------------------------------
 # Check-runs cache entry
@@ -66,6 +82,13 @@ class CheckRunsCacheEntry:
     cached_at: float  # time.monotonic()
 
 
+@dataclass
+class CommentsCacheEntry:
+    updated_at: datetime | None  # the issue's / PR's updatedAt when fetched
+    comments: list  # list[Comment] — forward reference to avoid circular import
+    cached_at: float  # time.monotonic()
+
+
 # ---------------------------------------------------------------------------
 # Caching decorators for Repo instance methods
 # ---------------------------------------------------------------------------
@@ -162,6 +185,10 @@ class Repo:
         self._tick_cache: dict[str, Any] = {}
         # Cross-tick cache: head_sha -> CheckRunsCacheEntry
         self._check_runs_cache: dict[str, CheckRunsCacheEntry] = {}
+        # Cross-tick cache: issue number -> CommentsCacheEntry
+        self._issue_comments_cache: dict[int, CommentsCacheEntry] = {}
+        # Cross-tick cache: PR number -> CommentsCacheEntry (inline review comments)
+        self._pr_inline_comments_cache: dict[int, CommentsCacheEntry] = {}
         # TTL cache: method_name -> (result, monotonic_timestamp)
         self._ttl_cache: dict[str, tuple[Any, float]] = {}
         # Configurable TTL for the milestones cache (seconds); can be overridden by callers.
@@ -186,8 +213,11 @@ class Repo:
     @staticmethod
     @functools.lru_cache(maxsize=1)
     def detect_bot_name() -> str:
-        """Detect the authenticated GitHub user's login via the gh CLI."""
-        return run_gh("gh", "api", "user", "-q", ".login")
+        """Detect the authenticated GitHub user's login via the gh CLI.
+
+        Uses :data:`BOT_NAME_ENV` when the supervisor has already detected it.
+        """
+        return os.environ.get(BOT_NAME_ENV) or run_gh("gh", "api", "user", "-q", ".login")
 
     def detect_default_branch(self) -> str:
         """Detect the repository's default branch via the gh CLI.
@@ -270,8 +300,11 @@ class Repo:
 
     # --- Labels ---
 
-    def ensure_label(self, name: str, color: str, description: str) -> None:
-        """Create label if it doesn't exist.  Silently ignores conflicts (422)."""
+    def ensure_label(self, name: str, color: str, description: str) -> bool:
+        """Create label if it doesn't exist.  Silently ignores conflicts (422).
+
+        Returns True when the label exists afterwards, False on any other failure.
+        """
         try:
             self.client.gh(
                 "api", f"repos/{self.name}/labels",
@@ -290,12 +323,34 @@ class Repo:
                     "Failed to provision label %r in %s: %s",
                     name, self.name, (e.stderr or "").strip(),
                 )
+                return False
+        return True
+
+    def ensure_required_labels(self, sentinel: Path | None = None) -> None:
+        """Provision all labels required by loony-dev into this repo.
 
-    def ensure_required_labels(self) -> None:
-        """Provision all labels required by loony-dev into this repo."""
+        When *sentinel* is given and holds the digest of the current
+        ``REQUIRED_LABELS``, provisioning already succeeded for this label set
+        and the API calls are skipped. The sentinel is (re)written only after
+        every label was provisioned, so a partial failure is retried next time.
+        """
+        if sentinel is not None:
+            try:
+                if sentinel.read_text(encoding="utf-8").strip() == _REQUIRED_LABELS_DIGEST:
+                    logger.debug("Required labels already provisioned for %s", self.name)
+                    return
+            except OSError:
+                pass
         logger.info("Provisioning required labels for %s", self.name)
+        ok = True
         for label in REQUIRED_LABELS:
-            self.ensure_label(**label)
+            ok = self.ensure_label(**label) and ok
+        if ok and sentinel is not None:
+            try:
+                sentinel.parent.mkdir(parents=True, exist_ok=True)
+                sentinel.write_text(_REQUIRED_LABELS_DIGEST + "\n", encoding="utf-8")
+            except OSError as exc:
+                logger.debug("Could not write label sentinel %s: %s", sentinel, exc)
 
     # --- Collection proxies ---
 
@@ -350,9 +405,11 @@ class Repo:
             raise
 
     def post_comment(self, number: int, body: str) -> None:
-        from loony_dev.models import truncate_for_log
-        logger.debug("post_comment(#%d): %s", number, truncate_for_log(body))
-        self.client.gh("issue", "comment", str(number), "--body", body)
+        if logger.isEnabledFor(logging.DEBUG):
+            from loony_dev.models import truncate_for_log
+            logger.debug("post_comment(#%d): %s", number, truncate_for_log(body))
+        self._issue_comments_cache.pop(number, None)
+        self.client.gh("issue", "comment", str(number), "--body-file", "-", input=body)
 
     def get_issue_comments(self, number: int) -> list:
         """Get comments on an issue, sorted by creation time."""
@@ -31,7 +31,7 @@ class HookFailureError(Exception):
         self.output = output
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskResult:
     success: bool
     output: str
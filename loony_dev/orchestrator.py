@@ -25,10 +25,10 @@ from __future__ import annotations
 import concurrent.futures
 import contextlib
 import logging
+import operator
 import shutil
 import signal
 import threading
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -64,10 +64,10 @@ logger = logging.getLogger(__name__)
 # pipeline, see ``loony_dev/pipeline.py``) rather than scanning these directly;
 # this registry is retained as the canonical priority list and a test seam for
 # the per-class ``discover()`` paths.
-TASK_CLASSES = sorted(
-    [StuckItemCleanupTask, ConflictResolutionTask, CIFailureTask, PRReviewTask, PlanningTask, IssueTask],
-    key=lambda tc: tc.priority,
-)
+TASK_CLASSES: tuple[type[Task], ...] = tuple(sorted(
+    (StuckItemCleanupTask, ConflictResolutionTask, CIFailureTask, PRReviewTask, PlanningTask, IssueTask),
+    key=operator.attrgetter("priority"),
+))
 
 
 class Orchestrator:
@@ -112,6 +112,9 @@ class Orchestrator:
         self.max_concurrent = max(1, int(resolved_max))
         self._shutdown_requested: bool = False
         self._graceful_shutdown: bool = False
+        # Set alongside ``_shutdown_requested`` so the inter-tick wait wakes
+        # immediately instead of polling the flag.
+        self._shutdown_event = threading.Event()
 
         # Thread pool that runs the per-task worktree lifecycle + agent
         # execution concurrently. The tick loop itself stays single-threaded;
@@ -166,11 +169,8 @@ class Orchestrator:
                 except Exception:
                     logger.exception("Error during tick")
 
-                # Interruptible sleep: check shutdown flag each second.
-                for _ in range(self.interval):
-                    if self._shutdown_requested:
-                        break
-                    time.sleep(1)
+                # Interruptible sleep: a shutdown signal sets the event.
+                self._shutdown_event.wait(self.interval)
             # Drain in-flight tasks *while the handler is still attached* so the
             # records they emit as they finish (terminal callbacks, milestones)
             # still reach their pipeline logs. Cleanup happens in the finally.
@@ -194,9 +194,9 @@ class Orchestrator:
         return handler
 
     def _handle_signal(self, signum: int, frame: object) -> None:
-        # Signal handlers must stay minimal: only flip flags here. All locking,
-        # git, and GitHub work happens later in _on_shutdown on the run-loop
-        # thread, where it is safe.
+        # Signal handlers must stay minimal: only flip flags (and wake the
+        # inter-tick wait) here. All locking, git, and GitHub work happens later
+        # in _on_shutdown on the run-loop thread, where it is safe.
         if signum == signal.SIGQUIT:
             logger.info("SIGQUIT received — will drain in-flight tasks then shut down.")
             self._shutdown_requested = True
@@ -204,6 +204,7 @@ class Orchestrator:
         else:
             logger.info("Signal %s received, shutting down…", signum)
             self._shutdown_requested = True
+        self._shutdown_event.set()
 
     def _on_shutdown(self) -> None:
         """Drain (graceful) or cancel-and-roll-back (immediate) in-flight tasks."""
@@ -392,10 +393,16 @@ class Orchestrator:
         ``_task_identity`` in-flight dedupe — is unchanged.
         """
         from loony_dev.pipeline import Pipeline
+        from loony_dev.tasks.stuck_item_task import stuck_params
 
+        # One stuck-item cutoff per tick, so every pipeline is judged against
+        # the same clock reading and config lookup.
+        stuck = stuck_params()
         candidates: list[Task] = []
-        for pipeline in Pipeline.discover(self.repo):
-            task = pipeline.next_task(self.repo)
+        pipelines = list(Pipeline.discover(self.repo))
+        Pipeline.prefetch_comments(pipelines, self.repo)
+        for pipeline in pipelines:
+            task = pipeline.next_task(self.repo, stuck)
             if task is not None:
                 logger.debug(
                     "Pipeline %s -> task '%s'", pipeline.pipeline_key, task.task_type,
@@ -416,7 +423,7 @@ class Orchestrator:
         # Stable sort by priority preserves pipeline enumeration order within a
         # priority tier, so the global ordering matches the old class-by-class
         # scan (which emitted every priority-5 task before any priority-10, …).
-        candidates.sort(key=lambda t: t.priority)
+        candidates.sort(key=operator.attrgetter("priority"))
 
         seen = set(claimed)
         results: list[tuple[Task, Agent]] = []
@@ -508,11 +515,13 @@ class Orchestrator:
             # All of this touches the base checkout's index/refs/worktree list
             # and is NOT safe to run concurrently, so it is serialized.
             with self._git_lock:
-                try:
-                    logger.debug("Current branch before sync: %s", self.git.current_branch())
-                    logger.debug("Uncommitted changes before sync: %s", self.git.has_uncommitted_changes())
-                except Exception:
-                    logger.debug("Could not read git state before sync", exc_info=True)
+                # Both probes fork git, so only pay for them when the output is kept.
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        logger.debug("Current branch before sync: %s", self.git.current_branch())
+                        logger.debug("Uncommitted changes before sync: %s", self.git.has_uncommitted_changes())
+                    except Exception:
+                        logger.debug("Could not read git state before sync", exc_info=True)
                 # Sync the base checkout so the ref the worktree forks from is current.
                 self.git.ensure_main_up_to_date()
 
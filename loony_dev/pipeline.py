@@ -21,6 +21,7 @@ idempotent.
 """
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 from collections.abc import Iterator
 from typing import TYPE_CHECKING
@@ -38,6 +39,8 @@ from loony_dev.tasks.stuck_item_task import (
 )
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from loony_dev.github import Issue, PullRequest, Repo
     from loony_dev.tasks.base import Task
 
@@ -61,6 +64,23 @@ def _default_branch(repo: Repo) -> str:
     return cached
 
 
+def _reads_comments(issue: Issue, repo: Repo) -> bool:
+    """True if ``planning_action`` / ``issue_action`` would read *issue*'s comments."""
+    labels = issue.labels
+    if "in-error" in labels:
+        return False
+    if "ready-for-planning" not in labels and "ready-for-development" not in labels:
+        return False
+    return not issue.has_other_assignee(repo.bot_name)
+
+
+def _reads_inline_comments(pr: PullRequest, repo: Repo) -> bool:
+    """True if ``pr_review_action`` would read *pr*'s inline review comments."""
+    if "in-progress" in pr.labels or "in-error" in pr.labels:
+        return False
+    return pr.is_assigned_to(repo.bot_name)
+
+
 class Pipeline:
     """One logical work-thread, keyed by branch (``issue-N`` or ``pr-P``).
 
@@ -96,16 +116,28 @@ class Pipeline:
         # Issues across the relevant labels, deduped by number (an issue can hold
         # more than one of these labels — e.g. ready-for-planning +
         # ready-for-development while a plan awaits approval).
+        # The per-label issue lists and the open-PR list are independent gh
+        # calls, so they run concurrently; results are consumed in label order.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(_RELEVANT_ISSUE_LABELS) + 1,
+            thread_name_prefix="discover",
+        ) as pool:
+            prs_future = pool.submit(PullRequest.list_open, repo=repo)
+            issue_lists = list(pool.map(
+                lambda label: Issue.list(label=label, repo=repo), _RELEVANT_ISSUE_LABELS,
+            ))
+            open_prs = prs_future.result()
+
         issues_by_number: dict[int, Issue] = {}
-        for label in _RELEVANT_ISSUE_LABELS:
-            for issue in Issue.list(label=label, repo=repo):
+        for issues in issue_lists:
+            for issue in issues:
                 issues_by_number.setdefault(issue.number, issue)
         for issue in issues_by_number.values():
             key = f"issue-{issue.number}"
             pipelines[key] = Pipeline(key, issue=issue)
 
         # Group open PRs onto their originating issue's pipeline, or a per-PR one.
-        for pr in PullRequest.list_open(repo=repo):
+        for pr in open_prs:
             _, worktree_key = issue_or_pr_keys(pr)
             pipeline = pipelines.get(worktree_key)
             if pipeline is None:
@@ -124,11 +156,34 @@ class Pipeline:
 
         yield from pipelines.values()
 
+    @staticmethod
+    def prefetch_comments(pipelines: list[Pipeline], repo: Repo) -> None:
+        """Batch-load the comments ``next_task`` will read across *pipelines*.
+
+        Kept out of :meth:`discover` because the dashboard enumerates pipelines
+        too and never reads comments. Only issues whose planning/implementation
+        rung can reach a comment read, and PRs the review rung would examine,
+        are prefetched — one batched GraphQL call each instead of one per item.
+        Raises ``CommentFetchError`` on failure.
+        """
+        from loony_dev.github import Issue, PullRequest
+
+        Issue.prefetch_comments(
+            [p.issue for p in pipelines if p.issue is not None and _reads_comments(p.issue, repo)],
+            repo=repo,
+        )
+        PullRequest.prefetch_inline_comments(
+            [p.pr for p in pipelines if p.pr is not None and _reads_inline_comments(p.pr, repo)],
+            repo=repo,
+        )
+
     # ------------------------------------------------------------------
     # next_task — the single highest-priority action, as a pure read
     # ------------------------------------------------------------------
 
-    def next_task(self, repo: Repo) -> Task | None:
+    def next_task(
+        self, repo: Repo, stuck: tuple[int, datetime] | None = None,
+    ) -> Task | None:
         """Return this pipeline's single highest-priority actionable task, or None.
 
         Walks the same priority ladder the orchestrator used across six task
@@ -136,10 +191,14 @@ class Pipeline:
         task. Each rung is a pure predicate over already-fetched GitHub/git
         state (the same helpers ``discover()`` delegates to), so this never
         mutates GitHub and never accumulates state.
+
+        *stuck* is the ``(threshold_hours, cutoff)`` pair from
+        :func:`stuck_params`; the orchestrator computes it once per tick and
+        shares it across pipelines. When omitted it is computed here.
         """
         # Priority 5 — stuck cleanup (issue facet first, then PR, matching the
         # old StuckItemCleanupTask.discover ordering).
-        threshold_hours, cutoff = stuck_params()
+        threshold_hours, cutoff = stuck if stuck is not None else stuck_params()
         if self.issue is not None:
             task = stuck_issue_action(self.issue, threshold_hours, cutoff)
             if task is not None:
@@ -30,6 +30,7 @@ no restarts); ``SIGINT`` / ``SIGTERM`` shut down immediately.
 
 from __future__ import annotations
 
+import concurrent.futures
 import fnmatch
 import hashlib
 import json
@@ -41,6 +42,7 @@ import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
 
 from collections.abc import Callable
@@ -50,6 +52,7 @@ from pathlib import Path
 
 from loony_dev import config
 from loony_dev.github import Repo
+from loony_dev.github.repo import BOT_NAME_ENV
 
 logger = logging.getLogger(__name__)
 
@@ -195,20 +198,6 @@ def list_accessible_repos() -> list[str]:
 # Repository filtering
 # ---------------------------------------------------------------------------
 
-def _matches_pattern(repo: str, pattern: str) -> bool:
-    """Return True if *repo* ('owner/repo') matches *pattern*.
-
-    Patterns containing '/' are matched against the full 'owner/repo' string.
-    Patterns without '/' are matched against the repo name portion only.
-    Matching uses fnmatch (case-sensitive on Linux).
-    """
-    if "/" in pattern:
-        return fnmatch.fnmatch(repo, pattern)
-    # Match against the repo name portion only
-    repo_name = repo.split("/", 1)[-1]
-    return fnmatch.fnmatch(repo_name, pattern)
-
-
 def filter_repos(
     repos: list[str],
     include: list[str] | None,
@@ -224,14 +213,38 @@ def filter_repos(
     result = repos
 
     if include:
-        result = [r for r in result if any(_matches_pattern(r, p) for p in include)]
+        matches = _compile_patterns(include)
+        result = [r for r in result if matches(r)]
 
     if exclude:
-        result = [r for r in result if not any(_matches_pattern(r, p) for p in exclude)]
+        matches = _compile_patterns(exclude)
+        result = [r for r in result if not matches(r)]
 
     return result
 
 
+def _compile_patterns(patterns: list[str]) -> Callable[[str], bool]:
+    """Return a predicate: does an 'owner/repo' string match any of *patterns*?
+
+    Patterns containing '/' are matched against the full 'owner/repo' string.
+    Patterns without '/' are matched against the repo name portion only.
+    Matching uses fnmatch syntax (case-sensitive). Each group is translated
+    and joined into one alternation, so a repo is tested against at most two
+    compiled regexes rather than once per pattern.
+    """
+    full = [fnmatch.translate(p) for p in patterns if "/" in p]
+    name = [fnmatch.translate(p) for p in patterns if "/" not in p]
+    full_re = re.compile("|".join(full)) if full else None
+    name_re = re.compile("|".join(name)) if name else None
+
+    def matches(repo: str) -> bool:
+        if full_re is not None and full_re.match(repo):
+            return True
+        return name_re is not None and name_re.match(repo.split("/", 1)[-1]) is not None
+
+    return matches
+
+
 # ---------------------------------------------------------------------------
 # Repository checkout / removal
 # ---------------------------------------------------------------------------
@@ -272,18 +285,62 @@ def ensure_repo_checked_out(repo: str, base_dir: Path) -> Path:
 
     logger.info("Cloning %s into %s …", repo, repo_dir)
     try:
+        # Output is captured, not inherited: several clones can run at once
+        # (see _prepare_repo), and their progress would interleave on the
+        # console. The outcome is logged per repo instead.
         subprocess.run(
             ["gh", "repo", "clone", repo, str(repo_dir)],
             check=True,
+            capture_output=True,
+            text=True,
         )
         logger.info("Cloned %s successfully.", repo)
     except subprocess.CalledProcessError as exc:
-        logger.error("Failed to clone %s: exit code %d", repo, exc.returncode)
+        logger.error(
+            "Failed to clone %s: exit code %d: %s",
+            repo, exc.returncode, (exc.stderr or "").strip(),
+        )
         raise
 
     return repo_dir
 
 
+# Tier-1 default (see ``--prepare-concurrency`` in ``cli.py`` and the
+# ``[supervisor]`` section of ``config.toml.example``): upper bound on new repos
+# prepared concurrently in one discovery pass. The work is clone + label
+# provisioning — gh subprocesses waiting on the network. Used as the fallback
+# when the setting is absent.
+_DEFAULT_PREPARE_CONCURRENCY = 8
+
+
+def _prepare_repo(repo: str, base_dir: Path) -> Path | None:
+    """Check out *repo*, configure its hooks, and provision its labels.
+
+    Everything a new repo needs before its worker can launch. Returns the
+    checkout path, or ``None`` if the clone failed (the repo is skipped this
+    cycle). Label provisioning failures are logged and tolerated. Safe to run
+    for several repos concurrently: each touches only its own directories.
+    """
+    try:
+        work_dir = ensure_repo_checked_out(repo, base_dir)
+    except Exception:
+        logger.error("Skipping %s this cycle due to clone failure.", repo)
+        return None
+
+    _configure_git_hooks(repo, work_dir)
+
+    owner, name = repo.split("/", 1)
+    log_dir = base_dir / ".logs" / owner / name
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        Repo(repo).ensure_required_labels(sentinel=log_dir / "labels.provisioned")
+    except Exception:
+        logger.warning("Label provisioning failed for %s; continuing to launch worker.", repo)
+
+    return work_dir
+
+
 def remove_repo(repo: str, base_dir: Path) -> None:
     """Remove the checkout directory for *repo* at base_dir/owner/repo.
 
@@ -340,9 +397,13 @@ def _run_worker_process(
     import sys
 
     # Duplicate file descriptors so subprocesses (e.g. claude) log here too.
-    with open(log_file, "a") as f:
-        os.dup2(f.fileno(), sys.stdout.fileno())
-        os.dup2(f.fileno(), sys.stderr.fileno())
+    # Only the raw fd is needed for dup2, so skip the buffered file object.
+    fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.dup2(fd, sys.stdout.fileno())
+        os.dup2(fd, sys.stderr.fileno())
+    finally:
+        os.close(fd)
 
     # Update Python-level standard streams just in case
     log_file_obj = open(log_file, "a")
@@ -803,18 +864,34 @@ def _terminate_process(
     _remove_pid_file(pid_file)
 
 
-def _interruptible_sleep(seconds: float, should_stop: Callable[[], bool]) -> None:
-    """Sleep up to *seconds*, waking early (in <=1s) once *should_stop* is true."""
-    deadline = time.monotonic() + seconds
-    while not should_stop() and time.monotonic() < deadline:
-        time.sleep(min(1.0, deadline - time.monotonic()))
+# First retry delay after ``list_accessible_repos`` comes back empty (gh outage,
+# revoked token); doubles per consecutive failure up to --refresh-interval.
+# not configurable: retry cadence bounded by refresh_interval, the operator knob.
+_DISCOVERY_RETRY_DELAY = 60.0
+
+
+def _discovery_backoff(refresh_interval: float, failures: int) -> float:
+    """Return the delay before the next discovery after *failures* empty results.
+
+    Zero failures is the healthy cadence, *refresh_interval*. After a failure
+    discovery retries sooner — ``_DISCOVERY_RETRY_DELAY``, doubling per
+    consecutive failure — but never waits longer than *refresh_interval*.
+    """
+    if failures == 0:
+        return refresh_interval
+    return min(_DISCOVERY_RETRY_DELAY * (2 ** (failures - 1)), refresh_interval)
+
+
+def _interruptible_sleep(seconds: float, stop: threading.Event) -> None:
+    """Sleep up to *seconds*, waking immediately once *stop* is set."""
+    stop.wait(seconds)
 
 
 def _restart_after_backoff(
     record: WorkerProcess | RemoteControlProcess,
     label: str,
     relaunch: Callable[[], WorkerProcess | RemoteControlProcess],
-    should_stop: Callable[[], bool],
+    stop: threading.Event,
 ) -> WorkerProcess | RemoteControlProcess | None:
     """Apply exponential backoff, then relaunch *record* via *relaunch*.
 
@@ -830,8 +907,8 @@ def _restart_after_backoff(
     )
     logger.info("Restarting %s for %s in %.1fs…", label, record.repo, delay)
 
-    _interruptible_sleep(delay, should_stop)
-    if should_stop():
+    _interruptible_sleep(delay, stop)
+    if stop.is_set():
         return None
 
     try:
@@ -860,24 +937,26 @@ def run_supervisor() -> None:
     web_proc: WebProcess | None = None
     web_log_file = config.settings.base_dir / ".logs" / "web.log"
     web_pid_file = config.settings.base_dir / ".logs" / "web.pid"
-    shutdown_requested = False
+    # Set by the signal handler; every wait in the loop blocks on it, so a
+    # shutdown wakes the supervisor at once instead of at the next poll.
+    shutdown_event = threading.Event()
     graceful_shutdown = False
 
     def handle_signal(signum: int, frame: object) -> None:
-        nonlocal shutdown_requested, graceful_shutdown
+        nonlocal graceful_shutdown
         if signum == signal.SIGQUIT:
             logger.info("SIGQUIT received — supervisor will shut down after current tasks complete.")
-            shutdown_requested = True
             graceful_shutdown = True
         else:
             logger.info("Signal %d received; shutting down supervisor…", signum)
-            shutdown_requested = True
+        shutdown_event.set()
 
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
     signal.signal(signal.SIGQUIT, handle_signal)
 
     last_discovery: float = 0.0  # Force discovery on first iteration
+    discovery_failures = 0
 
     logger.info(
         "Supervisor started. base_dir=%s interval=%ds refresh=%ds",
@@ -888,6 +967,13 @@ def run_supervisor() -> None:
     if config.settings.exclude:
         logger.info("Exclude patterns: %s", config.settings.exclude)
 
+    # Detect the bot login once and hand it to every spawned worker via the
+    # environment; on failure each worker falls back to detecting it itself.
+    try:
+        os.environ.setdefault(BOT_NAME_ENV, Repo.detect_bot_name())
+    except subprocess.CalledProcessError:
+        logger.warning("Bot login detection failed; workers will detect it themselves.")
+
     if config.settings.get("web"):
         try:
             web_proc = launch_web(
@@ -899,21 +985,27 @@ def run_supervisor() -> None:
         except Exception:
             logger.exception("Failed to launch web dashboard")
 
-    while not shutdown_requested:
+    while not shutdown_event.is_set():
         now = time.monotonic()
 
         # ------------------------------------------------------------------ #
         # Discovery phase
         # ------------------------------------------------------------------ #
-        if now - last_discovery >= config.settings.refresh_interval:
+        discovery_delay = _discovery_backoff(config.settings.refresh_interval, discovery_failures)
+        if now - last_discovery >= discovery_delay:
             last_discovery = now
             logger.info("Running repo discovery…")
 
             accept_pending_invitations()
             all_repos = list_accessible_repos()
             if not all_repos:
-                logger.warning("No repos discovered (gh returned nothing or failed). Will retry on next refresh.")
+                discovery_failures += 1
+                logger.warning(
+                    "No repos discovered (gh returned nothing or failed). Will retry in %.0fs.",
+                    _discovery_backoff(config.settings.refresh_interval, discovery_failures),
+                )
             else:
+                discovery_failures = 0
                 active = filter_repos(all_repos, config.settings.include, config.settings.exclude)
                 logger.info(
                     "Discovered %d repos; %d match filters.",
@@ -928,27 +1020,31 @@ def run_supervisor() -> None:
                 active_set = set(active)
                 current_set = set(workers.keys())
 
-                # Start workers for new repos
-                for repo in active:
-                    if repo in workers:
-                        continue
-                    try:
-                        work_dir = ensure_repo_checked_out(repo, config.settings.base_dir)
-                    except Exception:
-                        logger.error("Skipping %s this cycle due to clone failure.", repo)
+                # Start workers for new repos. Clone + label provisioning are
+                # independent per repo and network-bound, so they run
+                # concurrently; launches then proceed in discovery order.
+                new_repos = [repo for repo in active if repo not in workers]
+                prepared: dict[str, Path | None] = {}
+                if new_repos:
+                    prepare_concurrency = max(1, int(config.settings.get(
+                        "prepare_concurrency", _DEFAULT_PREPARE_CONCURRENCY
+                    )))
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(len(new_repos), prepare_concurrency),
+                        thread_name_prefix="prepare-repo",
+                    ) as pool:
+                        prepared = dict(zip(new_repos, pool.map(
+                            lambda repo: _prepare_repo(repo, config.settings.base_dir),
+                            new_repos,
+                        )))
+                for repo in new_repos:
+                    work_dir = prepared[repo]
+                    if work_dir is None:
                         continue
 
-                    _configure_git_hooks(repo, work_dir)
-
                     owner, name = repo.split("/", 1)
                     log_path = config.settings.base_dir / ".logs" / owner / name / "loony-worker.log"
                     pid_path = config.settings.base_dir / ".logs" / owner / name / "loony-worker.pid"
-                    log_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    try:
-                        Repo(repo).ensure_required_labels()
-                    except Exception:
-                        logger.warning("Label provisioning failed for %s; continuing to launch worker.", repo)
 
                     try:
                         wp = launch_worker(
@@ -996,13 +1092,12 @@ def run_supervisor() -> None:
                         _remove_connection_file(rcp.conn_file)
                     remove_repo(repo, config.settings.base_dir)
 
-        if shutdown_requested:
+        if shutdown_event.is_set():
             break
 
         # ------------------------------------------------------------------ #
         # Health-check phase
         # ------------------------------------------------------------------ #
-        should_stop = lambda: shutdown_requested  # noqa: E731
 
         for repo, wp in list(workers.items()):
             rc = wp.process.exitcode
@@ -1032,14 +1127,14 @@ def run_supervisor() -> None:
                     pid_file=wp.pid_file,
                     base_dir=config.settings.base_dir,
                 ),
-                should_stop,
+                shutdown_event,
             )
-            if shutdown_requested:
+            if shutdown_event.is_set():
                 break
             if new_wp is not None:
                 workers[repo] = new_wp
 
-        if shutdown_requested:
+        if shutdown_event.is_set():
             break
 
         # Remote-control servers restart with the same backoff as workers, but —
@@ -1108,14 +1203,14 @@ def run_supervisor() -> None:
                     pid_file=rcp.pid_file,
                     conn_file=rcp.conn_file,
                 ),
-                should_stop,
+                shutdown_event,
             )
-            if shutdown_requested:
+            if shutdown_event.is_set():
                 break
             if new_rcp is not None:
                 remote_controls[repo] = new_rcp
 
-        if shutdown_requested:
+        if shutdown_event.is_set():
             break
 
         # The web dashboard is a single child (not per-repo); restart it with the
@@ -1138,8 +1233,8 @@ def run_supervisor() -> None:
                 logger.info("Restarting web dashboard in %.1fs…", delay)
                 prev_count = web_proc.restart_count
                 web_proc = None
-                _interruptible_sleep(delay, should_stop)
-                if shutdown_requested:
+                _interruptible_sleep(delay, shutdown_event)
+                if shutdown_event.is_set():
                     break
                 try:
                     web_proc = launch_web(
@@ -1153,9 +1248,7 @@ def run_supervisor() -> None:
                     logger.exception("Failed to restart web dashboard")
 
         # Interruptible sleep for the health-check interval
-        sleep_deadline = time.monotonic() + config.settings.interval
-        while not shutdown_requested and time.monotonic() < sleep_deadline:
-            time.sleep(min(1.0, sleep_deadline - time.monotonic()))
+        shutdown_event.wait(config.settings.interval)
 
     # ---------------------------------------------------------------------- #
     # Shutdown
@@ -75,12 +75,11 @@ class IssueTask(Task):
     @staticmethod
     def _find_plan(comments: list[Comment], bot_name: str) -> str | None:
         """Return the text of the most recent approved plan comment, or None."""
-        plan: str | None = None
-        for c in comments:
+        for c in reversed(comments):
             if c.author == bot_name and c.body.startswith(PLAN_MARKER_PREFIX):
                 end = c.body.find("-->")
-                plan = c.body[end + 3:].strip() if end >= 0 else c.body[len(PLAN_MARKER):].strip()
-        return plan
+                return c.body[end + 3:].strip() if end >= 0 else c.body[len(PLAN_MARKER):].strip()
+        return None
 
     # ------------------------------------------------------------------
     # Task interface
@@ -158,16 +157,17 @@ class IssueTask(Task):
         # approval). The transition to implementation is the right point to drop
         # it — moved here from the old planning-discovery side effect (#197) so
         # pipeline discovery stays a pure read.
+        remove = ["ready-for-development"]
         if "ready-for-planning" in self.issue.labels:
             logger.debug("Issue #%d: removing stale 'ready-for-planning' label", self.issue.number)
-            self.issue.remove_label("ready-for-planning")
-        self.issue.remove_label("ready-for-development")
-        self.issue.add_label("in-progress")
+            remove.insert(0, "ready-for-planning")
+        self.issue.update_labels(add=["in-progress"], remove=remove)
         self.issue.assign()
 
     def on_complete(self, repo: Repo, result: TaskResult) -> None:
         logger.debug("Issue #%d: removing 'in-progress', posting completion comment", self.issue.number)
-        logger.debug("Completion comment body: %s", truncate_for_log(result.summary))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Completion comment body: %s", truncate_for_log(result.summary))
         self.issue.remove_label("in-progress")
 
         status_notes = ""
@@ -178,7 +178,8 @@ class IssueTask(Task):
             )
             if self.hook_output:
                 safe_output = _sanitize_hook_output(self.hook_output)
-                logger.debug("Full hook output: %s", truncate_for_log(self.hook_output))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full hook output: %s", truncate_for_log(self.hook_output))
                 status_notes += (
                     f"\n\n<details><summary>Hook output</summary>\n\n"
                     f"```\n{safe_output}\n```\n</details>"
@@ -212,14 +213,14 @@ class IssueTask(Task):
             "Issue #%d: task failed (%s), removing 'in-progress'",
             self.issue.number, error,
         )
-        self.issue.remove_label("in-progress")
         if isinstance(error, RateLimitedError):
             logger.info(
                 "Issue #%d: rate-limited — skipping error comment (quota will reset automatically)",
                 self.issue.number,
             )
-            self.issue.add_label("ready-for-development")
+            self.issue.update_labels(add=["ready-for-development"], remove=["in-progress"])
             return
+        self.issue.remove_label("in-progress")
         failure_body = f"{FAILURE_MARKER}\n\nImplementation failed: {error}"
         in_error = self.issue.check_and_post_failure(
             failure_body,
@@ -143,29 +143,23 @@ class PlanningTask(Task):
         comments: list[Comment], bot_name: str
     ) -> tuple[str | None, int | None, list[Comment]]:
         """Return (existing_plan, existing_plan_comment_id, new_user_comments_since_last_plan)."""
-        bot_last_plan_idx = -1
-        bot_last_plan: str | None = None
-        bot_last_plan_comment_id: int | None = None
-
-        for i, c in enumerate(comments):
+        # Scan from the end: only the most recent plan matters, and it is
+        # usually near the tail of the thread.
+        for i in range(len(comments) - 1, -1, -1):
+            c = comments[i]
             if c.author == bot_name and c.body.startswith(PLAN_MARKER_PREFIX):
-                bot_last_plan_idx = i
-                bot_last_plan_comment_id = c.id
-                end = c.body.find("-->")
-                bot_last_plan = c.body[end + 3:].strip() if end >= 0 else c.body[len(PLAN_MARKER):].strip()
+                break
+        else:
+            return None, None, [c for c in comments if c.author != bot_name]
 
-        if bot_last_plan_idx == -1:
-            new_comments = [c for c in comments if c.author != bot_name]
+        end = c.body.find("-->")
+        plan = c.body[end + 3:].strip() if end >= 0 else c.body[len(PLAN_MARKER):].strip()
+        last_seen = decode_last_seen(c.body)
+        if last_seen is not None:
+            new_comments = [x for x in comments if x.author != bot_name and x.created_at > last_seen]
         else:
-            last_seen = decode_last_seen(comments[bot_last_plan_idx].body)
-            if last_seen is not None:
-                new_comments = [c for c in comments if c.author != bot_name and c.created_at > last_seen]
-            else:
-                new_comments = [
-                    c for c in comments[bot_last_plan_idx + 1:] if c.author != bot_name
-                ]
-
-        return bot_last_plan, bot_last_plan_comment_id, new_comments
+            new_comments = [x for x in comments[i + 1:] if x.author != bot_name]
+        return plan, c.id, new_comments
 
     # ------------------------------------------------------------------
     # Task interface
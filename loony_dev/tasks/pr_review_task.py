@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import operator
 from collections.abc import Iterator
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from loony_dev.models import RateLimitedError, truncate_for_log
@@ -103,27 +105,35 @@ class PRReviewTask(Task):
         comments = list(pr.comments)
         comments += [r for r in pr.reviews if r.body]
         comments.extend(pr.inline_comments)
-        comments.sort(key=lambda c: c.created_at)
+        # General comments and review bodies arrive chronological, so Timsort
+        # merges those runs in near-linear time. Inline comments come back
+        # grouped by thread rather than globally ordered, which rules out a
+        # plain heapq.merge.
+        comments.sort(key=operator.attrgetter("created_at"))
         return comments
 
     @staticmethod
     def _new_since_bot(comments: list[Comment], bot_name: str) -> list[Comment]:
         """Return non-bot comments after the bot's last *successful* response."""
+        # Scan from the end: only the most recent success marker matters.
         bot_last_success_idx = -1
-        bot_last_success_body: str | None = None
-        for i, c in enumerate(comments):
+        for i in range(len(comments) - 1, -1, -1):
+            c = comments[i]
             if c.author == bot_name and c.body.startswith(SUCCESS_MARKER_PREFIX):
                 bot_last_success_idx = i
-                bot_last_success_body = c.body
+                break
 
         if bot_last_success_idx == -1:
             result = [c for c in comments if c.author != bot_name]
         else:
-            last_seen = decode_last_seen(bot_last_success_body or "")
+            last_seen = decode_last_seen(comments[bot_last_success_idx].body)
             if last_seen is not None:
                 result = [c for c in comments if c.author != bot_name and c.created_at > last_seen]
             else:
-                result = [c for c in comments[bot_last_success_idx + 1:] if c.author != bot_name]
+                result = [
+                    c for c in islice(comments, bot_last_success_idx + 1, None)
+                    if c.author != bot_name
+                ]
 
         logger.debug(
             "_new_since_bot: last success marker at index %d, returning %d new comment(s)",
@@ -178,7 +188,7 @@ class PRReviewTask(Task):
         repo_name = repo.name.split("/", 1)[1] if "/" in repo.name else repo.name
 
         comments_text = "\n\n".join(
-            self._format_comment(c) for c in self.pr.new_comments
+            [self._format_comment(c) for c in self.pr.new_comments]
         )
 
         return {
@@ -219,7 +229,8 @@ class PRReviewTask(Task):
         last_seen_ts = max((c.created_at for c in self.pr.new_comments), default="")
         marker = encode_marker(SUCCESS_MARKER_PREFIX, last_seen_ts) if last_seen_ts else SUCCESS_MARKER
         if result.post_summary:
-            logger.debug("Completion comment body: %s", truncate_for_log(result.summary))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Completion comment body: %s", truncate_for_log(result.summary))
             self.pr.add_comment(
                 f"{marker}\n\nReview comments addressed.\n\n{result.summary}",
             )
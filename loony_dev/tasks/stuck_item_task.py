@@ -14,12 +14,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def stuck_params() -> tuple[int, datetime]:
-    """Return ``(threshold_hours, cutoff)`` for the stuck-item check this tick."""
+def stuck_params(now: datetime | None = None) -> tuple[int, datetime]:
+    """Return ``(threshold_hours, cutoff)`` for the stuck-item check this tick.
+
+    *now* defaults to the current UTC time; callers that evaluate many items in
+    one tick pass a single timestamp so every item is judged against the same
+    cutoff.
+    """
     from loony_dev import config
 
+    if now is None:
+        now = datetime.now(timezone.utc)
     threshold_hours = int(config.settings.get("stuck_threshold_hours", 12))
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=threshold_hours)
+    cutoff = now - timedelta(hours=threshold_hours)
     return threshold_hours, cutoff
 
 
@@ -66,19 +73,23 @@ class StuckItemCleanupTask(Task):
     priority = 5
 
     def __init__(self, item: Issue | PullRequest, threshold_hours: int) -> None:
+        from loony_dev.github import Issue
+
         self.item = item
         self.threshold_hours = threshold_hours
+        # Resolved once here rather than re-checked in each lifecycle hook.
+        self._is_issue = isinstance(item, Issue)
 
     # ------------------------------------------------------------------
     # Task discovery
     # ------------------------------------------------------------------
 
     @staticmethod
-    def discover(repo: Repo) -> Iterator[StuckItemCleanupTask]:
+    def discover(repo: Repo, now: datetime | None = None) -> Iterator[StuckItemCleanupTask]:
         """Yield cleanup tasks for issues and PRs stuck in-progress past the threshold."""
         from loony_dev.github import Issue, PullRequest
 
-        threshold_hours, cutoff = stuck_params()
+        threshold_hours, cutoff = stuck_params(now)
 
         for issue in Issue.list(label="in-progress", repo=repo):
             task = stuck_issue_action(issue, threshold_hours, cutoff)
@@ -95,9 +106,7 @@ class StuckItemCleanupTask(Task):
     # ------------------------------------------------------------------
 
     def describe(self) -> str:
-        from loony_dev.github import Issue
-
-        kind = "Issue" if isinstance(self.item, Issue) else "PR"
+        kind = "Issue" if self._is_issue else "PR"
         return (
             f"Clean up stuck {kind} #{self.item.number}: {self.item.title}\n\n"
             f"This item has been labeled in-progress for over {self.threshold_hours} hours "
@@ -110,9 +119,7 @@ class StuckItemCleanupTask(Task):
         return None
 
     def on_start(self, repo: Repo) -> None:
-        from loony_dev.github import Issue
-
-        kind = "issue" if isinstance(self.item, Issue) else "PR"
+        kind = "issue" if self._is_issue else "PR"
         logger.info(
             "Resetting stuck %s #%d (%s), in-progress since %s",
             kind, self.item.number, self.item.title, self.item.updated_at,
@@ -123,16 +130,14 @@ class StuckItemCleanupTask(Task):
         )
 
     def on_complete(self, repo: Repo, result: TaskResult) -> None:
-        from loony_dev.github import Issue
-
-        self.item.remove_label("in-progress")
-        if isinstance(self.item, Issue):
-            self.item.add_label("ready-for-development")
+        if self._is_issue:
+            self.item.update_labels(add=["ready-for-development"], remove=["in-progress"])
             logger.info(
                 "Issue #%d reset: removed in-progress, restored ready-for-development",
                 self.item.number,
             )
         else:
+            self.item.remove_label("in-progress")
             logger.info("PR #%d reset: removed in-progress", self.item.number)
 
     def on_failure(self, repo: Repo, error: Exception) -> None:
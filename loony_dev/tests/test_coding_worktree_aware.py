@@ -133,6 +133,48 @@ class TestExecuteIssueWorktreeAware(unittest.TestCase):
 
         self.assertIsNone(open_mock.call_args.args[1])
 
+    def test_summary_overlaps_pr_creation_in_pipeline_context(self) -> None:
+        """The summary call runs beside ``_create_pr`` and keeps the pipeline log context."""
+        import threading
+
+        from loony_dev import pipeline_log
+
+        fake_git = MagicMock()
+        fake_git.count_commits_ahead.return_value = 0
+        agent = CodingAgent()
+        task = self._make_task()
+        session = MagicMock()
+        session.send_turn.return_value = _turn("implemented")
+        summary_started = threading.Event()
+        seen: dict[str, object] = {}
+
+        def fake_summary(output: str, work_dir: Path) -> str:
+            seen["pipeline"] = pipeline_log.current_pipeline.get()
+            seen["output"] = output
+            summary_started.set()
+            return "summarised"
+
+        def fake_create_pr(*_args: object) -> None:
+            # Only returns once the summary is running alongside it.
+            self.assertTrue(summary_started.wait(timeout=5))
+
+        with pipeline_log.pipeline_log_context("issue-7"), \
+                patch("loony_dev.git.GitRepo") as GitRepoCls, \
+                patch("loony_dev.coderabbit.is_available", return_value=False), \
+                patch.object(agent, "_open_session", return_value=session), \
+                patch.object(agent, "_close_session"), \
+                patch.object(agent, "_generate_commit_message", return_value="feat: x"), \
+                patch.object(agent, "_save_commit_message"), \
+                patch.object(agent, "_create_pr", side_effect=fake_create_pr), \
+                patch.object(agent, "_generate_summary", side_effect=fake_summary):
+            GitRepoCls.detect_default_branch.return_value = "main"
+            GitRepoCls.return_value = fake_git
+            result = agent.execute_issue(task, self.worktree)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.summary, "summarised")
+        self.assertEqual(seen, {"pipeline": "issue-7", "output": "implemented"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -103,6 +103,19 @@ class TestCreatePrIdempotency(unittest.TestCase):
             with patch("subprocess.run", return_value=success_proc):
                 self.agent._create_pr(task, "feature/42", "main", Path("/fake/repo"))
 
+    def test_body_is_sent_on_stdin(self) -> None:
+        task = _mock_task()
+        success_proc = MagicMock(spec=subprocess.CompletedProcess)
+        success_proc.returncode = 0
+        success_proc.stdout = "https://github.com/org/repo/pull/99\n"
+        with self._patch_repo_name("org/repo"):
+            with patch("subprocess.run", return_value=success_proc) as run:
+                self.agent._create_pr(task, "feature/42", "main", Path("/fake/repo"))
+        cmd = run.call_args.args[0]
+        self.assertEqual(run.call_args.kwargs["input"], "Closes #42")
+        self.assertNotIn("--body", cmd)
+        self.assertEqual(cmd[cmd.index("--body-file") + 1], "-")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import subprocess
+import tempfile
 import time
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from loony_dev.github.client import GitHubClient, _DEFAULTS, gh_setting, is_retryable_gh_error
+from loony_dev.github.comment import Comment
+from loony_dev.github.issue import Issue
 from loony_dev.github.pull_request import PullRequest
 from loony_dev.github.check_run import CheckRun
+from loony_dev.github.repo import BOT_NAME_ENV, REQUIRED_LABELS, Repo
 
 
 def _make_repo() -> MagicMock:
@@ -49,6 +54,212 @@ class TestTickCacheListOpen(unittest.TestCase):
         assert repo.client.gh_json.call_count == 2
 
 
+class _RacingCache(dict):
+    """Dict that drops *victim* on the first removal, as a pool thread's add_comment would."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.victim: int | None = None
+
+    def _race(self) -> None:
+        victim, self.victim = self.victim, None
+        if victim is not None:
+            dict.pop(self, victim, None)
+
+    def pop(self, key, *default):
+        self._race()
+        return super().pop(key, *default)
+
+    def __delitem__(self, key) -> None:
+        self._race()
+        super().__delitem__(key)
+
+
+class TestIssueCommentsCache(unittest.TestCase):
+    """Issue comments and PR inline comments are reused across ticks while updatedAt is unchanged."""
+
+    def _setup(self):
+        from datetime import datetime, timezone
+        repo = _make_repo()
+        repo.client = MagicMock()
+        repo._issue_comments_cache = {}
+        stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return repo, stamp
+
+    def test_unchanged_issue_reuses_comments(self) -> None:
+        repo, stamp = self._setup()
+        with patch.object(Comment, "list_for_issues", return_value={7: []}) as fetch:
+            Issue.prefetch_comments([Issue(number=7, updated_at=stamp, _repo=repo)], repo=repo)
+            Issue.prefetch_comments([Issue(number=7, updated_at=stamp, _repo=repo)], repo=repo)
+        fetch.assert_called_once()
+
+    def test_updated_issue_refetches(self) -> None:
+        from datetime import timedelta
+        repo, stamp = self._setup()
+        with patch.object(Comment, "list_for_issues", return_value={7: []}) as fetch:
+            Issue.prefetch_comments([Issue(number=7, updated_at=stamp, _repo=repo)], repo=repo)
+            later = stamp + timedelta(minutes=1)
+            Issue.prefetch_comments([Issue(number=7, updated_at=later, _repo=repo)], repo=repo)
+        assert fetch.call_count == 2
+
+    def test_own_comment_evicts_entry(self) -> None:
+        repo, stamp = self._setup()
+        issue = Issue(number=7, updated_at=stamp, _repo=repo)
+        with patch.object(Comment, "list_for_issues", return_value={7: []}):
+            Issue.prefetch_comments([issue], repo=repo)
+        issue.add_comment("hello")
+        assert 7 not in repo._issue_comments_cache
+
+    def test_repo_and_warning_writes_evict_entry(self) -> None:
+        from loony_dev.github.comment import WarningComment
+        repo, stamp = self._setup()
+        real = Repo("owner/repo", bot_name="loony-bot")
+        real.client = repo.client
+        real.client.gh_json.return_value = {"comments": []}
+        with patch.object(Comment, "list_for_issues", return_value={7: [], 8: []}):
+            Issue.prefetch_comments(
+                [Issue(number=7, updated_at=stamp, _repo=real),
+                 Issue(number=8, updated_at=stamp, _repo=real)],
+                repo=real,
+            )
+        real.post_comment(7, "hello")
+        WarningComment(number=8, field_name="body", injections=[], _repo=real).save()
+        assert real._issue_comments_cache == {}
+
+    def test_non_candidates_are_dropped(self) -> None:
+        repo, stamp = self._setup()
+        with patch.object(Comment, "list_for_issues", return_value={7: [], 8: []}):
+            Issue.prefetch_comments(
+                [Issue(number=7, updated_at=stamp, _repo=repo),
+                 Issue(number=8, updated_at=stamp, _repo=repo)],
+                repo=repo,
+            )
+            Issue.prefetch_comments([Issue(number=7, updated_at=stamp, _repo=repo)], repo=repo)
+        assert set(repo._issue_comments_cache) == {7}
+
+    def test_prune_tolerates_concurrent_eviction(self) -> None:
+        repo, stamp = self._setup()
+        repo._issue_comments_cache = _RacingCache()
+        issues = [Issue(number=n, updated_at=stamp, _repo=repo) for n in (7, 8, 9)]
+        with patch.object(Comment, "list_for_issues", return_value={7: [], 8: [], 9: []}):
+            Issue.prefetch_comments(issues, repo=repo)
+            repo._issue_comments_cache.victim = 9
+            Issue.prefetch_comments(issues[:1], repo=repo)
+        assert set(repo._issue_comments_cache) == {7}
+
+    def test_unchanged_pr_reuses_inline_comments(self) -> None:
+        from datetime import timedelta
+        repo, stamp = self._setup()
+        repo._pr_inline_comments_cache = {}
+        with patch.object(Comment, "list_inline_for_prs", return_value={3: []}) as fetch:
+            PullRequest.prefetch_inline_comments([PullRequest(number=3, updated_at=stamp, _repo=repo)], repo=repo)
+            PullRequest.prefetch_inline_comments([PullRequest(number=3, updated_at=stamp, _repo=repo)], repo=repo)
+            assert fetch.call_count == 1
+            later = stamp + timedelta(minutes=1)
+            PullRequest.prefetch_inline_comments([PullRequest(number=3, updated_at=later, _repo=repo)], repo=repo)
+        assert fetch.call_count == 2
+
+    def test_inline_prune_tolerates_concurrent_eviction(self) -> None:
+        repo, stamp = self._setup()
+        repo._pr_inline_comments_cache = _RacingCache()
+        prs = [PullRequest(number=n, updated_at=stamp, _repo=repo) for n in (3, 4, 5)]
+        with patch.object(Comment, "list_inline_for_prs", return_value={3: [], 4: [], 5: []}):
+            PullRequest.prefetch_inline_comments(prs, repo=repo)
+            repo._pr_inline_comments_cache.victim = 5
+            PullRequest.prefetch_inline_comments(prs[:1], repo=repo)
+        assert set(repo._pr_inline_comments_cache) == {3}
+
+
+class TestLabelMutationShortCircuit(unittest.TestCase):
+    """Adds a known label set already shows skip gh; removals always call it."""
+
+    def test_noop_add_skips_gh(self) -> None:
+        repo = _make_repo()
+        repo.client = MagicMock()
+        issue = Issue(number=7, labels=["in-progress"], _repo=repo)
+
+        assert issue.add_label("in-progress")
+
+        repo.client.gh.assert_not_called()
+
+    def test_remove_is_not_skipped_on_stale_snapshot(self) -> None:
+        # Discovery saw no in-progress, but a task added it since; the removal
+        # in on_complete must still reach GitHub.
+        repo = _make_repo()
+        repo.client = MagicMock()
+        issue = Issue(number=7, labels=["ready-for-development"], _repo=repo)
+
+        assert issue.remove_label("in-progress")
+        assert issue.update_labels(remove=["in-progress"])
+
+        assert repo.client.gh.call_count == 2
+
+    def test_successful_mutation_updates_labels(self) -> None:
+        repo = _make_repo()
+        repo.client = MagicMock()
+        issue = Issue(number=7, labels=["ready-for-development"], _repo=repo)
+
+        issue.remove_label("ready-for-development")
+        issue.add_label("in-progress")
+        issue.add_label("in-progress")
+
+        assert issue.labels == ["in-progress"]
+        assert repo.client.gh.call_count == 2
+
+    def test_update_labels_is_one_gh_call(self) -> None:
+        repo = _make_repo()
+        repo.client = MagicMock()
+        issue = Issue(number=7, labels=["ready-for-planning", "ready-for-development"], _repo=repo)
+
+        assert issue.update_labels(
+            add=["in-progress"], remove=["ready-for-planning", "ready-for-development", "in-error"],
+        )
+
+        repo.client.gh.assert_called_once_with(
+            "issue", "edit", "7",
+            "--add-label", "in-progress",
+            "--remove-label", "ready-for-planning",
+            "--remove-label", "ready-for-development",
+            "--remove-label", "in-error",
+        )
+        assert issue.labels == ["in-progress"]
+
+    def test_unknown_labels_always_call_gh(self) -> None:
+        repo = _make_repo()
+        repo.client = MagicMock()
+        issue = Issue(number=7, _repo=repo)
+
+        issue.remove_label("ready-for-planning")
+
+        repo.client.gh.assert_called_once()
+
+
+class TestRequiredLabelsSentinel(unittest.TestCase):
+    """ensure_required_labels should skip the API once the sentinel matches."""
+
+    def test_sentinel_skips_second_provisioning(self) -> None:
+        repo = Repo("owner/repo", bot_name="loony-bot")
+        repo.client = MagicMock()
+        with tempfile.TemporaryDirectory() as tmp:
+            sentinel = Path(tmp) / "labels.provisioned"
+
+            repo.ensure_required_labels(sentinel=sentinel)
+            repo.ensure_required_labels(sentinel=sentinel)
+
+        assert repo.client.gh.call_count == len(REQUIRED_LABELS)
+
+    def test_failure_leaves_no_sentinel(self) -> None:
+        repo = Repo("owner/repo", bot_name="loony-bot")
+        repo.client = MagicMock()
+        repo.client.gh.side_effect = subprocess.CalledProcessError(1, "gh", stderr="HTTP 500")
+        with tempfile.TemporaryDirectory() as tmp:
+            sentinel = Path(tmp) / "labels.provisioned"
+
+            repo.ensure_required_labels(sentinel=sentinel)
+
+            assert not sentinel.exists()
+
+
 # ---------------------------------------------------------------------------
 # Cross-tick cache: CheckRun.list_failing
 # ---------------------------------------------------------------------------
@@ -221,6 +432,33 @@ class TestGhRetry(unittest.TestCase):
         assert mock_run.call_count == 3
         assert mock_sleep.call_count == 2
 
+    @patch("loony_dev.github.client.time.sleep")
+    @patch("loony_dev.github.client.subprocess.run")
+    def test_stdin_input_is_resent_on_retry(self, mock_run: MagicMock, mock_sleep: MagicMock) -> None:
+        ok = MagicMock(stdout="", stderr="")
+        mock_run.side_effect = [_rate_limit_error(), ok]
+
+        client = GitHubClient("owner/repo")
+        client.gh("issue", "comment", "7", "--body-file", "-", input="hello")
+
+        assert [c.kwargs["input"] for c in mock_run.call_args_list] == ["hello", "hello"]
+
+    @patch("loony_dev.github.client.subprocess.run")
+    def test_comment_bodies_go_to_stdin_not_argv(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = MagicMock(stdout="", stderr="")
+        repo = Repo("owner/repo", bot_name="loony-bot")
+        body = "x" * 200_000  # larger than Linux's 128 KiB per-argument cap
+
+        Issue(number=7, _repo=repo).add_comment(body)
+        repo.post_comment(8, body)
+
+        for call in mock_run.call_args_list:
+            argv = call.args[0]
+            assert call.kwargs["input"] == body
+            assert "--body" not in argv
+            assert argv[argv.index("--body-file") + 1] == "-"
+            assert body not in argv
+
     def test_is_retryable_detects_rate_limit_patterns(self) -> None:
         for msg in ["API rate limit exceeded", "abuse detection mechanism", "secondary rate limit", "HTTP 403", "HTTP 429"]:
             exc = _rate_limit_error(msg)
@@ -263,5 +501,31 @@ class TestGithubConfig(unittest.TestCase):
             config_mod.settings = original
 
 
+# ---------------------------------------------------------------------------
+# Bot login detection
+# ---------------------------------------------------------------------------
+
+
+class TestDetectBotName(unittest.TestCase):
+    """Workers reuse the supervisor's detected login instead of forking gh."""
+
+    def setUp(self) -> None:
+        Repo.detect_bot_name.cache_clear()
+        self.addCleanup(Repo.detect_bot_name.cache_clear)
+
+    def test_env_hint_skips_gh(self) -> None:
+        with patch.dict("os.environ", {BOT_NAME_ENV: "loony-bot"}), \
+                patch("loony_dev.github.repo.run_gh") as run_gh:
+            assert Repo.detect_bot_name() == "loony-bot"
+        run_gh.assert_not_called()
+
+    def test_falls_back_to_gh_without_hint(self) -> None:
+        with patch.dict("os.environ", {}, clear=False) as env, \
+                patch("loony_dev.github.repo.run_gh", return_value="gh-user") as run_gh:
+            env.pop(BOT_NAME_ENV, None)
+            assert Repo.detect_bot_name() == "gh-user"
+        run_gh.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
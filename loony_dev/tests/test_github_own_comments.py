@@ -170,6 +170,25 @@ class TestCommentListForIssue(unittest.TestCase):
 
         self.assertEqual(Comment.list_for_issue(1, repo=repo), [])
 
+    def test_batched_read_splits_by_alias(self) -> None:
+        """list_for_issues issues one query and maps each alias back to its issue."""
+        repo = _make_repo()
+        repo.name = "o/r"
+        repo.client = MagicMock()
+        single = self._graphql_response()["data"]["repository"]["issueOrPullRequest"]
+        repo.client.gh_graphql.return_value = {
+            "data": {"repository": {"i1": single, "i2": None}}
+        }
+
+        by_number = Comment.list_for_issues([1, 2, 1], repo=repo)
+
+        repo.client.gh_graphql.assert_called_once()
+        query = repo.client.gh_graphql.call_args.args[0]
+        self.assertIn("i1: issueOrPullRequest(number:1)", query)
+        self.assertIn("i2: issueOrPullRequest(number:2)", query)
+        self.assertEqual([c.id for c in by_number[1]], [222, 111])
+        self.assertEqual(by_number[2], [])
+
     def test_bot_login_is_normalised(self) -> None:
         """A GraphQL Bot author round-trips with the REST-form ``[bot]`` suffix."""
         repo = _make_repo()
@@ -267,6 +286,23 @@ class TestCommentListInlineForPr(unittest.TestCase):
         with self.assertRaises(CommentFetchError):
             Comment.list_inline_for_pr(1, repo=repo)
 
+    def test_batched_read_splits_by_alias(self) -> None:
+        """list_inline_for_prs issues one query and maps each alias back to its PR."""
+        repo = self._make_repo()
+        single = self._graphql_response("User", "alice")["data"]["repository"]["pullRequest"]
+        repo.client.gh_graphql.return_value = {
+            "data": {"repository": {"p1": single, "p2": None}}
+        }
+
+        by_number = Comment.list_inline_for_prs([1, 2], repo=repo)
+
+        repo.client.gh_graphql.assert_called_once()
+        query = repo.client.gh_graphql.call_args.args[0]
+        self.assertIn("p1: pullRequest(number:1)", query)
+        self.assertIn("p2: pullRequest(number:2)", query)
+        self.assertEqual([(c.author, c.thread_id) for c in by_number[1]], [("alice", "t1")])
+        self.assertEqual(by_number[2], [])
+
 
 # ---------------------------------------------------------------------------
 # PullRequest._from_api
@@ -310,6 +346,14 @@ class TestPullRequestFromApi(unittest.TestCase):
         pr = PullRequest._from_api(self._pr_data("user", BOT_NAME), repo)
         self.assertFalse(pr.comments[0].body.is_safe)
 
+    def test_deleted_author_reads_as_empty_login(self) -> None:
+        repo = _make_repo()
+        data = self._pr_data("user", BOT_NAME)
+        data["comments"][0]["author"] = None
+        pr = PullRequest._from_api(data, repo)
+        self.assertEqual(pr.comments[0].author, "")
+        self.assertFalse(pr.comments[0].body.is_safe)
+
 
 # ---------------------------------------------------------------------------
 # Content safety basics
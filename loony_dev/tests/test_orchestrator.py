@@ -681,6 +681,31 @@ class TestPipelineLogWiring(unittest.TestCase):
         self.assertFalse(pipelines_dir.exists())
 
 
+class TestRunLoopShutdown(unittest.TestCase):
+    """A shutdown signal wakes the inter-tick wait instead of waiting it out."""
+
+    def test_signal_during_wait_exits_promptly(self) -> None:
+        import signal
+        import threading
+        import time
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        orch = _make_orchestrator(Path(tmpdir.name), _make_git(Path(tmpdir.name)), [MagicMock()])
+        self.assertEqual(orch.interval, 60)
+
+        def tick() -> None:
+            threading.Timer(0.05, orch._handle_signal, (signal.SIGTERM, None)).start()
+
+        start = time.monotonic()
+        with patch.object(orch, "_tick", side_effect=tick) as tick_mock, \
+                patch.object(orch, "_on_shutdown"), \
+                patch("loony_dev.orchestrator.signal.signal"):
+            orch.run()
+        self.assertLess(time.monotonic() - start, 5)
+        tick_mock.assert_called_once()
+
+
 class TestBaseDirThreading(unittest.TestCase):
     """An explicit base_dir wins over the git.work_dir fallback and reaches agents (#285)."""
 
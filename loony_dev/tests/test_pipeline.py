@@ -28,6 +28,7 @@ from loony_dev.github.pull_request import PullRequest
 from loony_dev.orchestrator import TASK_CLASSES, Orchestrator
 from loony_dev.pipeline import Pipeline
 from loony_dev.tasks.base import CI_FAILURE_MARKER
+from loony_dev.tasks.stuck_item_task import stuck_params
 
 BOT = "loony-bot"
 USER = "alice"
@@ -44,6 +45,8 @@ def _make_repo() -> MagicMock:
     repo.owner = "owner"
     repo.bot_name = BOT
     repo._tick_cache = {}
+    repo._issue_comments_cache = {}
+    repo._pr_inline_comments_cache = {}
     repo.is_authorized = MagicMock(return_value=True)
     repo.detect_default_branch.return_value = "main"
     return repo
@@ -117,12 +120,17 @@ def _world(
     def _comments_for(number: int, *, repo: MagicMock) -> list[Comment]:
         return issue_comments.get(number, [])
 
+    def _comments_for_many(numbers, *, repo: MagicMock) -> dict[int, list[Comment]]:
+        return {n: issue_comments.get(n, []) for n in numbers}
+
     def _failing(head_sha: str, *, repo: MagicMock) -> list[CheckRun]:
         return failing_checks.get(head_sha, [])
 
     with patch.object(Issue, "list", staticmethod(_issue_list)), \
          patch.object(Comment, "list_for_issue", staticmethod(_comments_for)), \
+         patch.object(Comment, "list_for_issues", staticmethod(_comments_for_many)), \
          patch.object(Comment, "list_inline_for_pr", staticmethod(lambda n, *, repo: [])), \
+         patch.object(Comment, "list_inline_for_prs", staticmethod(lambda ns, *, repo: {n: [] for n in ns})), \
          patch.object(CheckRun, "list_failing", staticmethod(_failing)):
         yield
 
@@ -192,6 +200,30 @@ class TestPipelineDiscovery(unittest.TestCase):
             pipelines = list(Pipeline.discover(repo))
         self.assertEqual(len(pipelines), 1)
 
+    def test_comment_prefetch_runs_on_tick_not_discover(self) -> None:
+        # The dashboard enumerates pipelines but never reads comments, so
+        # discover() itself must not pay for the batched comment read.
+        repo = _make_repo()
+        issue = _issue(7, labels=["ready-for-development"], repo=repo)
+        with _world(repo, issues=[issue]), \
+             patch.object(Comment, "list_for_issues", return_value={7: []}) as fetch:
+            list(Pipeline.discover(repo))
+            fetch.assert_not_called()
+            _make_orchestrator(repo, self)._find_work(limit=10, claimed=set())
+        fetch.assert_called_once()
+        self.assertEqual(list(fetch.call_args.args[0]), [7])
+
+    def test_inline_prefetch_runs_on_tick_not_discover(self) -> None:
+        repo = _make_repo()
+        pr = _pr(20, branch="feature/x", repo=repo)
+        with _world(repo, prs=[pr]), \
+             patch.object(Comment, "list_inline_for_prs", return_value={20: []}) as fetch:
+            list(Pipeline.discover(repo))
+            fetch.assert_not_called()
+            _make_orchestrator(repo, self)._find_work(limit=10, claimed=set())
+        fetch.assert_called_once()
+        self.assertEqual(list(fetch.call_args.args[0]), [20])
+
 
 # ---------------------------------------------------------------------------
 # next_task — the priority ladder
@@ -246,6 +278,23 @@ class TestNextTask(unittest.TestCase):
             task = Pipeline("issue-7", pr=pr).next_task(repo)
         self.assertEqual(task.task_type, "cleanup_stuck")
 
+    def test_shared_stuck_cutoff_is_honoured(self) -> None:
+        repo = _make_repo()
+        updated = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        pr = _pr(
+            20, branch="issue-7/slug", labels=["in-progress"],
+            updated_at=updated, repo=repo,
+        )
+        with _world(repo, prs=[pr]):
+            before = Pipeline("issue-7", pr=pr).next_task(
+                repo, stuck_params(now=updated + timedelta(hours=1)),
+            )
+            after = Pipeline("issue-7", pr=pr).next_task(
+                repo, stuck_params(now=updated + timedelta(days=2)),
+            )
+        self.assertIsNone(before)
+        self.assertEqual(after.task_type, "cleanup_stuck")
+
     def test_in_error_pr_parks(self) -> None:
         repo = _make_repo()
         pr = _pr(20, branch="issue-7/slug", labels=["in-error"], mergeable="CONFLICTING", repo=repo)
@@ -454,15 +503,16 @@ class TestPlanningLabelReconciliation(unittest.TestCase):
     def test_on_start_removes_stale_planning_label(self) -> None:
         repo, task = self._issue_task(["ready-for-planning", "ready-for-development"])
         task.on_start(repo)
-        removed = [c.args[0] for c in task.issue.remove_label.call_args_list]
-        self.assertIn("ready-for-planning", removed)
-        self.assertIn("ready-for-development", removed)
-        task.issue.add_label.assert_any_call("in-progress")
+        task.issue.update_labels.assert_called_once()
+        kwargs = task.issue.update_labels.call_args.kwargs
+        self.assertIn("ready-for-planning", kwargs["remove"])
+        self.assertIn("ready-for-development", kwargs["remove"])
+        self.assertEqual(kwargs["add"], ["in-progress"])
 
     def test_on_start_skips_planning_removal_when_absent(self) -> None:
         repo, task = self._issue_task(["ready-for-development"])
         task.on_start(repo)
-        removed = [c.args[0] for c in task.issue.remove_label.call_args_list]
+        removed = task.issue.update_labels.call_args.kwargs["remove"]
         self.assertNotIn("ready-for-planning", removed)
         self.assertIn("ready-for-development", removed)
 
@@ -473,11 +523,13 @@ class TestPlanningLabelReconciliation(unittest.TestCase):
         issue = _issue(7, labels=["ready-for-planning", "ready-for-development"], repo=repo)
         issue.remove_label = MagicMock()
         issue.add_label = MagicMock()
+        issue.update_labels = MagicMock()
         with _world(repo, issues=[issue]):
             task = Pipeline("issue-7", issue=issue).next_task(repo)
         self.assertEqual(task.task_type, "implement_issue")
         issue.remove_label.assert_not_called()
         issue.add_label.assert_not_called()
+        issue.update_labels.assert_not_called()
 
 
 if __name__ == "__main__":
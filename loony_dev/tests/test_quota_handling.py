@@ -170,6 +170,16 @@ class TestParseResetTime(unittest.TestCase):
         self.assertEqual(result.hour, 15)
         self.assertEqual(result.minute, 0)
 
+    def test_space_before_meridiem_and_midday(self) -> None:
+        result = ClaudeQuotaMixin._parse_reset_time("resets 12 pm (UTC)")
+        self.assertIsNotNone(result)
+        self.assertEqual(result.hour, 12)
+        self.assertEqual(result.minute, 0)
+
+    def test_out_of_range_clock_time(self) -> None:
+        self.assertIsNone(ClaudeQuotaMixin._parse_reset_time("resets 13pm (UTC)"))
+        self.assertIsNone(ClaudeQuotaMixin._parse_reset_time("resets 9:75am (UTC)"))
+
     def test_no_match(self) -> None:
         self.assertIsNone(ClaudeQuotaMixin._parse_reset_time("some random error"))
 
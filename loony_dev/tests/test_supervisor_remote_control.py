@@ -9,6 +9,8 @@ import json
 import struct
 import tempfile
 import termios
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -447,7 +449,7 @@ class RestartBackoffTestCase(unittest.TestCase):
             for n in range(8):
                 record = self._record(n)
                 supervisor._restart_after_backoff(
-                    record, "remote-control", lambda: new_record, lambda: False
+                    record, "remote-control", lambda: new_record, threading.Event()
                 )
         # 5, 10, 20, 40, 80, 160, 300 (capped), 300 (capped)
         self.assertEqual(delays, [5.0, 10.0, 20.0, 40.0, 80.0, 160.0, 300.0, 300.0])
@@ -457,7 +459,7 @@ class RestartBackoffTestCase(unittest.TestCase):
         new_record = self._record(0)
         with mock.patch.object(supervisor, "_interruptible_sleep"):
             result = supervisor._restart_after_backoff(
-                record, "remote-control", lambda: new_record, lambda: False
+                record, "remote-control", lambda: new_record, threading.Event()
             )
         self.assertIs(result, new_record)
         self.assertEqual(result.restart_count, 4)
@@ -465,9 +467,11 @@ class RestartBackoffTestCase(unittest.TestCase):
     def test_shutdown_during_delay_skips_relaunch(self) -> None:
         record = self._record(0)
         relaunch = mock.Mock()
+        stop = threading.Event()
+        stop.set()
         with mock.patch.object(supervisor, "_interruptible_sleep"):
             result = supervisor._restart_after_backoff(
-                record, "remote-control", relaunch, lambda: True
+                record, "remote-control", relaunch, stop
             )
         self.assertIsNone(result)
         relaunch.assert_not_called()
@@ -480,10 +484,41 @@ class RestartBackoffTestCase(unittest.TestCase):
 
         with mock.patch.object(supervisor, "_interruptible_sleep"):
             result = supervisor._restart_after_backoff(
-                record, "remote-control", boom, lambda: False
+                record, "remote-control", boom, threading.Event()
             )
         self.assertIsNone(result)
 
+    def test_interruptible_sleep_returns_once_stop_is_set(self) -> None:
+        stop = threading.Event()
+        stop.set()
+        started = time.monotonic()
+        supervisor._interruptible_sleep(30.0, stop)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+
+class DiscoveryBackoffTestCase(unittest.TestCase):
+    def test_doubles_per_failure_up_to_refresh_interval(self) -> None:
+        delays = [supervisor._discovery_backoff(300.0, n) for n in range(6)]
+        self.assertEqual(delays, [300.0, 60.0, 120.0, 240.0, 300.0, 300.0])
+
+    def test_never_exceeds_default_refresh_interval(self) -> None:
+        # --refresh-interval defaults to 1800; a failure must not push the next
+        # discovery past the healthy cadence.
+        delays = [supervisor._discovery_backoff(1800.0, n) for n in range(8)]
+        self.assertEqual(
+            delays, [1800.0, 60.0, 120.0, 240.0, 480.0, 960.0, 1800.0, 1800.0],
+        )
+
+
+class CloneOutputTestCase(unittest.TestCase):
+    def test_clone_output_is_captured_for_concurrent_prepares(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, \
+             mock.patch.object(supervisor.subprocess, "run") as run:
+            supervisor.ensure_repo_checked_out("acme/widgets", Path(tmp))
+        kwargs = run.call_args.kwargs
+        self.assertTrue(kwargs["capture_output"])
+        self.assertTrue(kwargs["text"])
+
 
 class TeardownTestCase(unittest.TestCase):
     def setUp(self) -> None: